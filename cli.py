@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-"""Command Line Interface for the Movie RAG System."""
+"""Thin shim for `python cli.py`; prefer the movierag-cli script."""
 
 import os
 import sys
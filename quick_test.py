@@ -1,10 +1,10 @@
 import sys
 
 sys.path.insert(0, "src")
-from rag.movie_rag_system import MovieRAGSystem
+from rag._singleton import get_rag_system
 
 print("Testing query system...")
-rag = MovieRAGSystem()
+rag = get_rag_system()
 movies = rag.get_available_movies()
 print(f"Movies: {movies}")
 
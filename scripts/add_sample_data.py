@@ -17,9 +17,9 @@ def add_sample_movies():
 
     try:
         from models.movie_data import MovieData, ReviewData
-        from rag.movie_rag_system import MovieRAGSystem
+        from rag._singleton import get_rag_system
 
-        rag_system = MovieRAGSystem()
+        rag_system = get_rag_system()
 
         # Sample movie 1: The Matrix (popular movie)
         matrix_reviews = [
@@ -110,14 +110,10 @@ def add_sample_movies():
             ratings={"imdb": 8.8, "rotten_tomatoes": 87, "metacritic": 74},
         )
 
-        # Add movies to database
-        print("Adding 'The Matrix' to database...")
-        rag_system.add_movie_data(matrix_movie)
-        print("✅ The Matrix added!")
-
-        print("Adding 'Inception' to database...")
-        rag_system.add_movie_data(inception_movie)
-        print("✅ Inception added!")
+        # Add both movies in one batched write (single embedding pass)
+        print("Adding 'The Matrix' and 'Inception' to database...")
+        rag_system.add_movies_bulk([matrix_movie, inception_movie])
+        print("✅ Sample movies added!")
 
         # Verify database
         stats = rag_system.get_database_stats()
@@ -151,9 +147,9 @@ def test_sample_query():
     print("=" * 30)
 
     try:
-        from rag.movie_rag_system import MovieRAGSystem
+        from rag._singleton import get_rag_system
 
-        rag_system = MovieRAGSystem()
+        rag_system = get_rag_system()
 
         # Test query
         question = "What do people think about The Matrix special effects?"
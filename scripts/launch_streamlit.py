@@ -2,29 +2,26 @@
 """Setup and launch Streamlit with sample data."""
 
 import os
-import subprocess
 import sys
 
+sys.path.insert(0, os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
 
 def setup_and_launch():
     """Setup sample data and launch Streamlit."""
     print("🚀 Movie RAG System - Quick Setup & Launch")
     print("=" * 50)
 
-    # Step 1: Add sample data
+    # Step 1: Add sample data (in-process, reuses the cached RAG system)
     print("1. Adding sample movie data...")
     try:
-        result = subprocess.run(
-            [sys.executable, "add_sample_data.py"],
-            capture_output=True,
-            text=True,
-            cwd=".",
-        )
-        if result.returncode == 0:
+        from add_sample_data import add_sample_movies
+
+        if add_sample_movies():
             print("✅ Sample data added successfully!")
         else:
-            print(f"⚠️  Sample data script output: {result.stdout}")
-            print(f"⚠️  Errors: {result.stderr}")
+            print("⚠️  Sample data setup reported errors (see above)")
     except Exception as e:
         print(f"⚠️  Could not add sample data: {e}")
 
@@ -36,10 +33,10 @@ def setup_and_launch():
     print("\n" + "=" * 50)
 
     try:
-        # Launch Streamlit
-        subprocess.run(
-            [sys.executable, "-m", "streamlit", "run", "src/app.py"], cwd="."
-        )
+        # Run in-process instead of spawning a second interpreter
+        from streamlit.web import bootstrap
+
+        bootstrap.run("src/app.py", False, [], flag_options={})
     except KeyboardInterrupt:
         print("\n👋 Streamlit stopped. Goodbye!")
     except Exception as e:
@@ -2,15 +2,20 @@
 
 import asyncio
 import os
-from typing import Any, Dict, List
+import threading
+import traceback
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Dict, List
 
 import streamlit as st
 from dotenv import load_dotenv
 
-from crews.movie_analysis_crew import MovieAnalysisCrew
 from models.movie_data import MovieData, ReviewData
 from rag.movie_rag_system import MovieRAGSystem
 
+if TYPE_CHECKING:
+    from crews.movie_analysis_crew import MovieAnalysisCrew
+
 # Load environment variables
 load_dotenv()
 
@@ -23,15 +28,89 @@ def get_rag_system() -> MovieRAGSystem:
 
 
 @st.cache_resource
-def get_analysis_crew() -> MovieAnalysisCrew:
+def get_analysis_crew() -> "MovieAnalysisCrew":
     """Initialize and cache the analysis crew."""
+    # Imported lazily so the crewai stack isn't loaded on page startup
+    from crews.movie_analysis_crew import MovieAnalysisCrew
+
     return MovieAnalysisCrew()
 
 
+@st.cache_data(ttl=30)
+def cached_available_movies() -> List[str]:
+    """Movie list for the sidebar, cached so reruns skip the Chroma scan."""
+    return get_rag_system().get_available_movies()
+
+
+@st.cache_data(ttl=30)
+def cached_database_stats() -> Dict[str, Any]:
+    """Database stats for the sidebar, cached so reruns skip the Chroma scan."""
+    return get_rag_system().get_database_stats()
+
+
+def invalidate_database_caches() -> None:
+    """Drop the cached movie list/stats after the database changes."""
+    cached_available_movies.clear()
+    cached_database_stats.clear()
+
+
+# Warm the RAG system on a background thread so the first sidebar
+# interaction doesn't block on Chroma/LLM initialization;
+# @st.cache_resource makes the warm-up and later calls share one instance
+if "rag_warming" not in st.session_state:
+    st.session_state["rag_warming"] = True
+    threading.Thread(target=get_rag_system, daemon=True).start()
+
+
+def ensure_handles() -> None:
+    """Bind the shared RAG handle to the session once.
+
+    Saves the st.cache_resource lookup-plus-lock on every widget rerun.
+    The crew handle is deliberately not bound here: constructing it
+    pulls in the crewai stack, so it stays deferred until the first
+    analysis actually needs it.
+    """
+    # setdefault would evaluate the factory (cache lookup plus lock) on
+    # every rerun just to discard the result, so guard explicitly
+    if "rag" not in st.session_state:
+        st.session_state["rag"] = get_rag_system()
+
+
+def answer_question(question: str, movie_title: str) -> str:
+    """Answer a question about a movie, serving repeats from a session cache.
+
+    Streamlit reruns the whole script on every widget interaction, so
+    without this an identical question would re-run retrieval and LLM
+    generation each time.
+    """
+    cache = st.session_state.setdefault("qa_cache", {})
+    key = (movie_title, question)
+    if key not in cache:
+        # movie_title goes through as a metadata filter so Chroma only
+        # scores that movie's documents instead of the whole corpus
+        cache[key] = get_rag_system().query_cached(question, movie_title)
+    return cache[key]
+
+
+def _select_movie_from_db() -> None:
+    """Consume the sidebar radio selection and reset it.
+
+    Runs as the radio's on_change callback, before the rerun; clearing
+    the widget back to the placeholder keeps later reruns from
+    re-entering the analysis path with a stale selection.
+    """
+    choice = st.session_state.get("db_movie_choice")
+    if choice and choice != "—":
+        st.session_state["selected_movie"] = choice
+        st.session_state["db_movie_choice"] = "—"
+
+
 def main() -> None:
     """Main Streamlit application."""
     st.set_page_config(page_title="Movie RAG System", page_icon="🎬", layout="wide")
 
+    ensure_handles()
+
     st.title("🎬 Movie Review Analysis System")
     st.markdown("Get comprehensive insights about movies from multiple review sources!")
 
@@ -63,16 +142,23 @@ def main() -> None:
 
         # Show existing movies in database
         with st.expander("🎬 Movies in Database"):
-            rag_system = get_rag_system()
-            available_movies = rag_system.get_available_movies()
-            stats = rag_system.get_database_stats()
+            available_movies = cached_available_movies()
+            stats = cached_database_stats()
 
             if available_movies:
                 st.write(f"**{stats.get('movies_count', 0)} movies available:**")
-                for movie in available_movies:
-                    if st.button(f"📊 Analyze '{movie}'", key=f"analyze_{movie}"):
-                        st.session_state["selected_movie"] = movie
-                        st.rerun()
+                # One radio widget instead of a button per movie keeps
+                # session-state bookkeeping O(1) as the database grows.
+                # The on_change callback fires only on the run where the
+                # selection actually changed and resets the widget to the
+                # placeholder, so the rerun doesn't re-trigger analysis
+                st.radio(
+                    "Analyze movie:",
+                    ["—"] + available_movies,
+                    index=0,
+                    key="db_movie_choice",
+                    on_change=_select_movie_from_db,
+                )
             else:
                 st.info("No movies in database yet. Try adding one above!")
 
@@ -125,12 +211,11 @@ def main() -> None:
 
 def analyze_existing_movie(movie_title: str) -> None:
     """Analyze a movie that's already in the database."""
-    rag_system = get_rag_system()
-    analysis_crew = get_analysis_crew()
+    rag_system = st.session_state["rag"]
 
     try:
         # Check if movie exists in database
-        available_movies = rag_system.get_available_movies()
+        available_movies = cached_available_movies()
         if movie_title not in available_movies:
             st.error(f"Movie '{movie_title}' not found in database!")
             return
@@ -140,7 +225,9 @@ def analyze_existing_movie(movie_title: str) -> None:
         st.success(f"✅ Analyzing '{movie_title}' from database...")
 
         # Query the database for this movie's reviews
-        query_result = rag_system.query(f"Tell me about {movie_title}")
+        query_result = rag_system.query(
+            "Tell me about this movie", movie_title=movie_title
+        )
 
         # Create a simple analysis result for existing movies
         st.header(f"📊 Analysis: {movie_title}")
@@ -157,7 +244,7 @@ def analyze_existing_movie(movie_title: str) -> None:
             )
             if question:
                 if st.button("Get Answer", key=f"answer_{movie_title}"):
-                    answer = rag_system.query(f"{movie_title}: {question}")
+                    answer = answer_question(question, movie_title)
                     st.markdown("**Answer:**")
                     st.markdown(answer)
 
@@ -169,8 +256,11 @@ def analyze_movie(
     movie_title: str, sources: Dict[str, bool], max_reviews: int, analysis_depth: str
 ) -> None:
     """Analyze a movie using the RAG system."""
-    rag_system = get_rag_system()
-    analysis_crew = get_analysis_crew()
+    rag_system = st.session_state["rag"]
+    # Built on first use so page load never pays for the crewai import
+    if "crew" not in st.session_state:
+        st.session_state["crew"] = get_analysis_crew()
+    analysis_crew = st.session_state["crew"]
 
     # Progress tracking
     progress_bar = st.progress(0)
@@ -190,17 +280,23 @@ def analyze_movie(
             st.error("❌ Movie not found or no reviews available!")
             return
 
-        # Step 2: Process and store in vector database
-        status_text.text("📝 Processing reviews...")
+        # Steps 2 & 3: store in the vector database and run the AI analysis.
+        # The two steps are independent once reviews are collected, so run
+        # them concurrently instead of back to back.
+        status_text.text("📝 Processing and analyzing reviews...")
         progress_bar.progress(50)
 
-        rag_system.add_movie_data(movie_data)
-
-        # Step 3: AI Analysis
-        status_text.text("🤖 Analyzing with AI...")
-        progress_bar.progress(80)
+        async def _process_and_analyze() -> Dict[str, Any]:
+            _, analysis = await asyncio.gather(
+                rag_system.add_movie_data_threaded(movie_data),
+                asyncio.to_thread(
+                    analysis_crew.analyze_movie, movie_data, analysis_depth
+                ),
+            )
+            return analysis
 
-        analysis_result = analysis_crew.analyze_movie(movie_data, analysis_depth)
+        analysis_result = asyncio.run(_process_and_analyze())
+        invalidate_database_caches()
 
         progress_bar.progress(100)
         status_text.text("✅ Analysis complete!")
@@ -210,7 +306,11 @@ def analyze_movie(
 
     except Exception as e:
         st.error(f"❌ Error during analysis: {str(e)}")
-        st.exception(e)
+        # Format the traceback once and keep it small; st.exception would
+        # re-render the full stack on every rerun
+        st.session_state["last_error"] = traceback.format_exc()[:4000]
+        with st.expander("Traceback"):
+            st.code(st.session_state["last_error"])
 
 
 def display_results(
@@ -229,7 +329,7 @@ def display_results(
         st.metric("Total Reviews", len(movie_data.reviews))
     with cols[2]:
         if movie_data.ratings:
-            avg_rating = sum(movie_data.ratings.values()) / len(movie_data.ratings)
+            avg_rating = movie_data.ratings_array.mean()
             st.metric("Avg Rating", f"{avg_rating:.1f}")
     with cols[3]:
         if movie_data.genre:
@@ -282,10 +382,8 @@ def display_reviews(reviews: List[ReviewData]) -> None:
     st.markdown("### 💬 Recent Reviews")
 
     # Group reviews by source
-    sources = {}
+    sources = defaultdict(list)
     for review in reviews:
-        if review.source not in sources:
-            sources[review.source] = []
         sources[review.source].append(review)
 
     for source, source_reviews in sources.items():
@@ -294,14 +392,10 @@ def display_reviews(reviews: List[ReviewData]) -> None:
                 cols = st.columns([3, 1])
                 with cols[0]:
                     st.markdown(f"**{review.author or 'Anonymous'}**")
-                    st.markdown(
-                        review.content[:300] + "..."
-                        if len(review.content) > 300
-                        else review.content
-                    )
+                    st.markdown(review.display_excerpt)
                 with cols[1]:
                     if review.rating:
-                        st.metric("Rating", f"{review.rating}")
+                        st.metric("Rating", review.rating_str)
 
 
 def display_qa_interface(rag_system: MovieRAGSystem, movie_title: str) -> None:
@@ -316,7 +410,7 @@ def display_qa_interface(rag_system: MovieRAGSystem, movie_title: str) -> None:
 
     if question and st.button("Get Answer"):
         with st.spinner("🔍 Searching for relevant information..."):
-            answer = rag_system.query(f"{movie_title}: {question}")
+            answer = answer_question(question, movie_title)
             st.markdown("**Answer:**")
             st.markdown(answer)
 
@@ -341,5 +435,19 @@ def display_detailed_insights(analysis_result: Dict[str, Any]) -> None:
                 st.markdown(f"- {con}")
 
 
+def run() -> None:
+    """Console entry point that launches the app under Streamlit.
+
+    Calling main() directly would run the script in bare mode with no
+    server, so hand this file to the Streamlit CLI instead.
+    """
+    import sys
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", __file__]
+    sys.exit(stcli.main())
+
+
 if __name__ == "__main__":
     main()
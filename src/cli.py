@@ -2,12 +2,14 @@
 
 import argparse
 import asyncio
+import atexit
 import logging
 import sys
-from typing import List, Optional
+from collections import Counter
+from typing import TYPE_CHECKING, List, Optional
 
-from models.movie_data import MovieData
-from rag.movie_rag_system import MovieRAGSystem
+if TYPE_CHECKING:
+    from rag.movie_rag_system import MovieRAGSystem
 
 
 def setup_logging(verbose: bool = False) -> None:
@@ -24,7 +26,7 @@ def setup_logging(verbose: bool = False) -> None:
 
 
 async def add_movie_command(
-    rag_system: MovieRAGSystem,
+    rag_system: "MovieRAGSystem",
     title: str,
     sources: List[str],
     max_reviews: int,
@@ -46,9 +48,9 @@ async def add_movie_command(
             print("❌ Movie not found or no data available!")
             return
 
-        # Add to database
+        # Add to database (on a worker thread so the loop stays free)
         print("📝 Adding to database...")
-        rag_system.add_movie_data(movie_data)
+        await rag_system.add_movie_data_threaded(movie_data)
 
         # Show summary
         print(f"\n✅ Successfully added '{movie_data.title}'")
@@ -57,9 +59,7 @@ async def add_movie_command(
         print(f"   Reviews collected: {len(movie_data.reviews)}")
 
         # Show source breakdown
-        source_counts = {}
-        for review in movie_data.reviews:
-            source_counts[review.source] = source_counts.get(review.source, 0) + 1
+        source_counts = Counter(review.source for review in movie_data.reviews)
 
         print("   Review breakdown:")
         for source, count in source_counts.items():
@@ -71,7 +71,7 @@ async def add_movie_command(
 
 
 def query_command(
-    rag_system: MovieRAGSystem, question: str, movie_title: Optional[str] = None
+    rag_system: "MovieRAGSystem", question: str, movie_title: Optional[str] = None
 ) -> None:
     """Query the RAG system."""
     print(f"\n❓ Question: {question}")
@@ -87,7 +87,7 @@ def query_command(
         logging.error(f"Error processing query '{question}': {e}")
 
 
-def list_movies_command(rag_system: MovieRAGSystem) -> None:
+def list_movies_command(rag_system: "MovieRAGSystem") -> None:
     """List all movies in the database."""
     try:
         movies = rag_system.get_available_movies()
@@ -105,7 +105,7 @@ def list_movies_command(rag_system: MovieRAGSystem) -> None:
         print(f"❌ Error listing movies: {e}")
 
 
-def stats_command(rag_system: MovieRAGSystem) -> None:
+def stats_command(rag_system: "MovieRAGSystem") -> None:
     """Show database statistics."""
     try:
         stats = rag_system.get_database_stats()
@@ -125,7 +125,7 @@ def stats_command(rag_system: MovieRAGSystem) -> None:
         print(f"❌ Error getting stats: {e}")
 
 
-def sentiment_command(rag_system: MovieRAGSystem, movie_title: str) -> None:
+def sentiment_command(rag_system: "MovieRAGSystem", movie_title: str) -> None:
     """Analyze sentiment for a movie."""
     try:
         sentiment = rag_system.get_sentiment_analysis(movie_title)
@@ -153,6 +153,19 @@ def sentiment_command(rag_system: MovieRAGSystem, movie_title: str) -> None:
 
 def main() -> None:
     """Main CLI function."""
+    # Fast path: bare `list`/`stats` take no options, so skip building the
+    # full subparser tree and go straight to a lightweight RAG system
+    if len(sys.argv) == 2 and sys.argv[1] in ("list", "stats"):
+        setup_logging(False)
+        from rag._singleton import get_rag_system
+
+        rag_system = get_rag_system(lightweight=True)
+        if sys.argv[1] == "list":
+            list_movies_command(rag_system)
+        else:
+            stats_command(rag_system)
+        return
+
     parser = argparse.ArgumentParser(
         description="Movie RAG System - Analyze movie reviews with AI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -225,9 +238,15 @@ Examples:
     # Setup logging
     setup_logging(args.verbose)
 
-    # Initialize RAG system
+    # Initialize RAG system (cached per process; list/stats skip LLM setup)
+    # Imported here so --help and argument errors don't pay the heavy
+    # chromadb/LLM import cost.
     print("🚀 Initializing Movie RAG System...")
-    rag_system = MovieRAGSystem()
+    from rag._singleton import get_rag_system
+
+    rag_system = get_rag_system(lightweight=args.command in ("list", "stats"))
+    # Drain any queued batched writes before the process exits
+    atexit.register(rag_system.flush)
 
     try:
         # Execute command
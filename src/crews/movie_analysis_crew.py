@@ -1,24 +1,374 @@
 """CrewAI-powered movie analysis crew."""
 
+import hashlib
+import json
 import logging
 import os
-from typing import Any, Dict, List
+import re
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
-from crewai import Agent, Crew, Task
-from crewai.tools import tool
-from langchain_openai import ChatOpenAI
+import numpy as np
 
 from models.movie_data import AnalysisResult, MovieData
 
 logger = logging.getLogger(__name__)
 
+# Placeholders filled by _load_crew_dependencies on first use: fallback-only
+# deployments (no OPENAI_API_KEY) never pay the crewai/langchain import cost
+Agent = None
+Crew = None
+Task = None
+ChatOpenAI = None
+
+
+def _load_crew_dependencies() -> None:
+    """Import the CrewAI/LangChain stack on first use."""
+    global Agent, Crew, Task, ChatOpenAI
+
+    if Agent is None or Crew is None or Task is None:
+        from crewai import Agent as _Agent, Crew as _Crew, Task as _Task
+
+        if Agent is None:
+            Agent = _Agent
+        if Crew is None:
+            Crew = _Crew
+        if Task is None:
+            Task = _Task
+
+    if ChatOpenAI is None:
+        from langchain_openai import ChatOpenAI as _ChatOpenAI
+
+        ChatOpenAI = _ChatOpenAI
+
+# Numba JIT-compiles the keyword scan to native code; the compiled-regex
+# path below remains the fallback when it isn't installed.
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    njit = None
+    _HAS_NUMBA = False
+
+
+# Aho-Corasick matches every keyword in one linear pass over the text;
+# the per-keyword scans below remain the fallback when it isn't installed.
+try:
+    import ahocorasick
+
+    _HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    _HAS_AHOCORASICK = False
+
+
+def _build_automaton(buckets: Mapping[str, Iterable[str]]):
+    """Build an Aho-Corasick automaton mapping each keyword to its bucket.
+
+    The stored value carries the keyword length so matches can be
+    boundary-checked without re-deriving it.
+    """
+    if not _HAS_AHOCORASICK:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for bucket, keywords in buckets.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (bucket, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _iter_word_matches(automaton, text: str):
+    """Yield bucket values for automaton hits, with regex semantics.
+
+    Aho-Corasick reports every raw substring, so two filters keep this
+    path identical to the regex fallback's word-boundary alternation:
+    hits flanked by word characters are dropped ("cast" inside
+    "broadcast"), and overlapping hits are resolved leftmost-longest
+    ("effects" inside a "special effects" match doesn't count twice).
+    """
+    last = len(text) - 1
+    candidates = []
+    for end, (bucket, length) in automaton.iter(text):
+        start = end - length + 1
+        if start > 0:
+            before = text[start - 1]
+            if before.isalnum() or before == "_":
+                continue
+        if end < last:
+            after = text[end + 1]
+            if after.isalnum() or after == "_":
+                continue
+        candidates.append((start, -length, bucket))
+
+    candidates.sort()
+    prev_end = 0
+    for start, neg_length, bucket in candidates:
+        if start < prev_end:
+            continue
+        prev_end = start - neg_length
+        yield bucket
+
+
+def _head_join(contents: List[str], limit: int) -> str:
+    """Join only enough leading strings to cover ``limit`` characters.
+
+    The task prompts embed at most a fixed-size prefix, so joining every
+    review's full content just to slice it away would allocate strings
+    proportional to the whole corpus.
+    """
+    buf = []
+    total = 0
+    for content in contents:
+        buf.append(content)
+        total += len(content) + 2  # separator
+        if total >= limit:
+            break
+    return "\n\n".join(buf)[:limit]
+
+
+def _pack_keywords(words: Iterable[str]) -> tuple:
+    """Pack keywords into a flat uint8 array plus offsets for the JIT scan."""
+    encoded = [word.encode("utf-8") for word in words]
+    flat = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(word) for word in encoded], out=offsets[1:])
+    return flat, offsets
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True)
+    def _is_word_byte(b):  # pragma: no cover
+        """Byte-level approximation of the regex \\w class.
+
+        Bytes >= 128 (UTF-8 continuation/lead bytes) count as word
+        characters so accented letters don't create false boundaries.
+        """
+        return (
+            (97 <= b <= 122)
+            or (65 <= b <= 90)
+            or (48 <= b <= 57)
+            or b == 95
+            or b >= 128
+        )
+
+    @njit(cache=True)
+    def _count_keywords_jit(content, kw_flat, kw_offsets):  # pragma: no cover
+        """Count word-boundary occurrences of every packed keyword.
+
+        Matches the \\b semantics of the regex fallback: a hit only
+        counts when it isn't flanked by word bytes on either side.
+        """
+        total = 0
+        n = content.shape[0]
+        for k in range(kw_offsets.shape[0] - 1):
+            start = kw_offsets[k]
+            end = kw_offsets[k + 1]
+            m = end - start
+            if m == 0 or m > n:
+                continue
+            for i in range(n - m + 1):
+                match = True
+                for j in range(m):
+                    if content[i + j] != kw_flat[start + j]:
+                        match = False
+                        break
+                if match:
+                    if i > 0 and _is_word_byte(content[i - 1]):
+                        continue
+                    if i + m < n and _is_word_byte(content[i + m]):
+                        continue
+                    total += 1
+        return total
+
+
+def _keyword_pattern(words: Iterable[str]) -> "re.Pattern":
+    """Compile a word-boundary alternation matching any of the keywords."""
+    # Longer phrases first so e.g. "visual effects" wins over "effects"
+    ordered = sorted(words, key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(map(re.escape, ordered)) + r")\b")
+
+
+# Keyword tables for the fallback analysis, built once at import and
+# frozen so every consumer shares the same allocation and none can
+# mutate (and silently desynchronize) them
+_POSITIVE_WORDS = (
+    "excellent",
+    "amazing",
+    "fantastic",
+    "brilliant",
+    "outstanding",
+    "superb",
+    "wonderful",
+    "great",
+    "good",
+    "impressive",
+    "remarkable",
+    "magnificent",
+)
+
+_NEGATIVE_WORDS = (
+    "terrible",
+    "awful",
+    "horrible",
+    "disappointing",
+    "poor",
+    "bad",
+    "worst",
+    "pathetic",
+    "boring",
+    "dull",
+    "weak",
+    "failed",
+)
+
+_THEME_KEYWORDS = MappingProxyType(
+    {
+        "Acting": (
+            "acting",
+            "performance",
+            "actor",
+            "actress",
+            "cast",
+            "character",
+        ),
+        "Plot": ("plot", "story", "storyline", "narrative", "script"),
+        "Direction": ("direction", "director", "directed", "directing"),
+        "Cinematography": (
+            "cinematography",
+            "visuals",
+            "camera",
+            "shots",
+            "photography",
+        ),
+        "Music/Sound": ("music", "soundtrack", "score", "sound", "audio"),
+        "Special Effects": ("effects", "cgi", "visual effects", "special effects"),
+        "Pacing": ("pacing", "pace", "slow", "fast", "rushed", "dragged"),
+        "Entertainment": (
+            "entertaining",
+            "fun",
+            "enjoyable",
+            "engaging",
+            "thrilling",
+        ),
+    }
+)
+
+_PROS_KEYWORDS = MappingProxyType(
+    {
+        "Great acting": ("great acting", "excellent performance", "brilliant cast"),
+        "Engaging plot": (
+            "interesting story",
+            "compelling plot",
+            "engaging narrative",
+        ),
+        "Beautiful visuals": (
+            "stunning visuals",
+            "beautiful cinematography",
+            "gorgeous shots",
+        ),
+        "Good direction": (
+            "well directed",
+            "excellent direction",
+            "masterful directing",
+        ),
+        "Entertaining": ("very entertaining", "highly enjoyable", "lots of fun"),
+    }
+)
+
+_CONS_KEYWORDS = MappingProxyType(
+    {
+        "Poor acting": ("bad acting", "poor performance", "terrible cast"),
+        "Weak plot": ("boring story", "confusing plot", "weak narrative"),
+        "Bad visuals": ("poor visuals", "bad cinematography", "ugly shots"),
+        "Poor direction": ("badly directed", "poor direction", "weak directing"),
+        "Boring": ("very boring", "not entertaining", "dull movie"),
+    }
+)
+
 
 class MovieAnalysisCrew:
     """CrewAI crew for comprehensive movie analysis."""
 
+    # Aliases onto the frozen module-level tables
+    POSITIVE_WORDS = _POSITIVE_WORDS
+    NEGATIVE_WORDS = _NEGATIVE_WORDS
+    THEME_KEYWORDS = _THEME_KEYWORDS
+    PROS_KEYWORDS = _PROS_KEYWORDS
+    CONS_KEYWORDS = _CONS_KEYWORDS
+
+    # Compiled once at import: one regex scan per review replaces a
+    # str.count pass per keyword
+    POS_RE = _keyword_pattern(POSITIVE_WORDS)
+    NEG_RE = _keyword_pattern(NEGATIVE_WORDS)
+    THEME_RE = _keyword_pattern(
+        [keyword for keywords in THEME_KEYWORDS.values() for keyword in keywords]
+    )
+    _KEYWORD_TO_THEME = {
+        keyword: theme
+        for theme, keywords in THEME_KEYWORDS.items()
+        for keyword in keywords
+    }
+
+    # Packed keyword tables for the Numba scan
+    POS_TABLE = _pack_keywords(POSITIVE_WORDS)
+    NEG_TABLE = _pack_keywords(NEGATIVE_WORDS)
+
+    # Aho-Corasick automatons, built once at import (None without the dep)
+    THEME_AUTOMATON = _build_automaton(THEME_KEYWORDS)
+    PROS_AUTOMATON = _build_automaton(PROS_KEYWORDS)
+    CONS_AUTOMATON = _build_automaton(CONS_KEYWORDS)
+
+    # Shared across instances so repeated crews reuse the LLM client's
+    # HTTP session and the already-built agents
+    _llm_cache: Dict[tuple, Any] = {}
+    _agents_cache: Dict[int, Dict[str, Any]] = {}
+
+    # LRU cache of analysis results keyed by review-content hash; repeat
+    # analyses of unchanged movies skip the crew/LLM entirely
+    _analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    _ANALYSIS_CACHE_SIZE = 64
+
+    # Thread pool shared by all crews for scanning large review lists;
+    # the regex/bytes scanning releases the GIL in C code
+    _SCAN_THRESHOLD = 64
+    _SCAN_CHUNK = 16
+    _scan_executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def _get_scan_executor(cls) -> ThreadPoolExecutor:
+        if cls._scan_executor is None:
+            cls._scan_executor = ThreadPoolExecutor(
+                max_workers=min(8, os.cpu_count() or 4),
+                thread_name_prefix="review-scan",
+            )
+        return cls._scan_executor
+
     def __init__(self):
         self.llm = self._initialize_llm()
-        self.agents = self._create_agents()
+        self._agents = None
+
+    @property
+    def agents(self) -> Dict[str, Any]:
+        """Analysis agents, built lazily on first use and shared per LLM."""
+        if self._agents is None:
+            cache_key = id(self.llm)
+            agents = MovieAnalysisCrew._agents_cache.get(cache_key)
+            if agents is None:
+                agents = self._create_agents()
+                if agents:
+                    MovieAnalysisCrew._agents_cache[cache_key] = agents
+            self._agents = agents
+        return self._agents
+
+    @agents.setter
+    def agents(self, value: Dict[str, Any]) -> None:
+        self._agents = value
 
     def _initialize_llm(self):
         """Initialize the language model for CrewAI."""
@@ -31,11 +381,21 @@ class MovieAnalysisCrew:
 
             if openai_api_key:
                 logger.info(f"CrewAI using OpenAI API with model: {openai_model}")
-                return ChatOpenAI(
-                    temperature=0.1,
-                    model_name=openai_model,
-                    openai_api_key=openai_api_key,
-                )
+                cache_key = (openai_model, openai_api_key)
+                llm = MovieAnalysisCrew._llm_cache.get(cache_key)
+                if llm is None:
+                    _load_crew_dependencies()
+                    # The JSON shape is requested at the task level via
+                    # expected_output; forcing JSON mode on the client
+                    # would also break the agent executor's intermediate
+                    # plain-text turns
+                    llm = ChatOpenAI(
+                        temperature=0.1,
+                        model_name=openai_model,
+                        openai_api_key=openai_api_key,
+                    )
+                    MovieAnalysisCrew._llm_cache[cache_key] = llm
+                return llm
             else:
                 if groq_api_key:
                     logger.info(
@@ -52,12 +412,13 @@ class MovieAnalysisCrew:
             logger.error(f"Failed to initialize LLM for CrewAI: {e}")
             return None
 
-    def _create_agents(self) -> Dict[str, Agent]:
+    def _create_agents(self) -> Dict[str, Any]:
         """Create specialized agents for movie analysis."""
 
         if not self.llm:
             return {}
 
+        _load_crew_dependencies()
         agents = {}
 
         # Review Analyst Agent
@@ -99,67 +460,64 @@ class MovieAnalysisCrew:
 
         return agents
 
-    @tool
-    def extract_review_themes(reviews_text: str) -> str:
-        """Extract main themes from movie reviews."""
-        # This would normally use more sophisticated NLP
-        # For now, return a simple analysis
-        return (
-            f"Analyzed themes from {len(reviews_text.split())} words of review content"
-        )
-
-    @tool
-    def calculate_sentiment_scores(reviews_text: str) -> str:
-        """Calculate sentiment scores for reviews."""
-        # Simple sentiment calculation
-        positive_words = [
-            "good",
-            "great",
-            "excellent",
-            "amazing",
-            "fantastic",
-            "brilliant",
-        ]
-        negative_words = [
-            "bad",
-            "terrible",
-            "awful",
-            "horrible",
-            "disappointing",
-            "poor",
-        ]
-
-        text_lower = reviews_text.lower()
-        positive_count = sum(text_lower.count(word) for word in positive_words)
-        negative_count = sum(text_lower.count(word) for word in negative_words)
-
-        return f"Positive indicators: {positive_count}, Negative indicators: {negative_count}"
+    @staticmethod
+    def _analysis_cache_key(movie_data: MovieData, analysis_depth: str) -> str:
+        """Hash the movie title, depth and review contents into a cache key."""
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{movie_data.title}|{analysis_depth}".encode("utf-8"))
+        for review in movie_data.reviews:
+            hasher.update(b"\x00")
+            hasher.update(review.content.encode("utf-8", "ignore"))
+        return hasher.hexdigest()
 
     def analyze_movie(
         self, movie_data: MovieData, analysis_depth: str = "Standard"
     ) -> Dict[str, Any]:
-        """Perform comprehensive movie analysis using CrewAI."""
+        """Perform comprehensive movie analysis using CrewAI.
+
+        Results are cached on the review-content hash, so re-analyzing an
+        unchanged movie returns immediately without LLM calls.
+        """
+
+        cache_key = self._analysis_cache_key(movie_data, analysis_depth)
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return cached
+
+        result = self._analyze_movie_uncached(movie_data, analysis_depth)
+
+        self._analysis_cache[cache_key] = result
+        if len(self._analysis_cache) > self._ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+
+        return result
+
+    def _analyze_movie_uncached(
+        self, movie_data: MovieData, analysis_depth: str
+    ) -> Dict[str, Any]:
+        """Run the actual crew or fallback analysis."""
 
         if not self.agents:
             return self._fallback_analysis(movie_data)
 
         try:
-            # Prepare review content
-            all_reviews = "\n\n".join([review.content for review in movie_data.reviews])
-            critic_reviews = "\n\n".join(
-                [
-                    review.content
-                    for review in movie_data.reviews
-                    if review.review_type == "critic"
-                ]
-            )
-            user_reviews = "\n\n".join(
-                [
-                    review.content
-                    for review in movie_data.reviews
-                    if review.review_type == "user"
-                ]
-            )
+            # Prepare review content, partitioning by type in one pass
+            # instead of walking the review list three times
+            all_contents: List[str] = []
+            critic_contents: List[str] = []
+            user_contents: List[str] = []
+            for review in movie_data.reviews:
+                all_contents.append(review.content)
+                if review.review_type == "critic":
+                    critic_contents.append(review.content)
+                else:
+                    user_contents.append(review.content)
+
+            # Join only the prefix each prompt can actually embed
+            all_reviews = _head_join(all_contents, 2000)
+            critic_reviews = _head_join(critic_contents, 1500)
+            user_reviews = _head_join(user_contents, 1500)
 
             # Create tasks based on analysis depth
             tasks = self._create_analysis_tasks(
@@ -167,6 +525,7 @@ class MovieAnalysisCrew:
             )
 
             # Create crew with tasks
+            _load_crew_dependencies()
             crew = Crew(agents=list(self.agents.values()), tasks=tasks, verbose=True)
 
             # Execute the crew
@@ -186,72 +545,22 @@ class MovieAnalysisCrew:
         critic_reviews: str,
         user_reviews: str,
         analysis_depth: str,
-    ) -> List[Task]:
-        """Create analysis tasks for the crew."""
+    ) -> List[Any]:
+        """Create the consolidated analysis task for the crew.
 
-        tasks = []
+        A single task asks for all three analysis sections as one JSON
+        object, so a full analysis costs one LLM round-trip instead of
+        three. The earlier per-section tasks never consumed each other's
+        output, so nothing is lost by merging them.
+        """
 
-        # Review Analysis Task
-        review_task = Task(
-            description=f"""
-            Analyze the following movie reviews for '{movie_data.title}':
-            
-            ALL REVIEWS:
-            {all_reviews[:2000]}...
-            
-            Extract:
-            1. Main themes and topics discussed
-            2. Most praised aspects
-            3. Most criticized aspects
-            4. Overall tone and reception
-            5. Key insights about the movie's reception
-            
-            Provide a structured analysis focusing on patterns and insights.
-            """,
-            expected_output="""A structured analysis report containing:
-            - Main themes and topics (3-5 key themes)
-            - Most praised aspects (top 3)
-            - Most criticized aspects (top 3)
-            - Overall tone and reception summary
-            - Key insights about the movie's reception""",
-            agent=self.agents["review_analyst"],
-        )
-        tasks.append(review_task)
+        _load_crew_dependencies()
 
-        # Sentiment Analysis Task
-        sentiment_task = Task(
+        analysis_task = Task(
             description=f"""
-            Perform detailed sentiment analysis on reviews for '{movie_data.title}':
-            
-            CRITIC REVIEWS:
-            {critic_reviews[:1500]}...
-            
-            USER REVIEWS:
-            {user_reviews[:1500]}...
-            
-            Analyze:
-            1. Overall sentiment distribution (positive/neutral/negative)
-            2. Differences between critic and audience sentiment
-            3. Specific emotional responses and reactions
-            4. Rating trends and patterns
-            
-            Provide quantitative and qualitative sentiment insights.
-            """,
-            expected_output="""A detailed sentiment analysis report containing:
-            - Overall sentiment distribution with percentages
-            - Comparison between critic and audience sentiment
-            - Specific emotional responses identified
-            - Rating trends and patterns analysis
-            - Quantitative metrics and qualitative insights""",
-            agent=self.agents["sentiment_analyst"],
-        )
-        tasks.append(sentiment_task)
+            Analyze the movie reviews for '{movie_data.title}' and respond
+            with a single JSON object.
 
-        # Summary Task
-        summary_task = Task(
-            description=f"""
-            Create a comprehensive summary of the analysis for '{movie_data.title}':
-            
             Movie Details:
             - Title: {movie_data.title}
             - Year: {movie_data.year}
@@ -259,27 +568,35 @@ class MovieAnalysisCrew:
             - Genre: {movie_data.genre}
             - Ratings: {movie_data.ratings}
             - Total Reviews: {len(movie_data.reviews)}
-            
-            Based on the review analysis and sentiment analysis, create:
-            1. Executive summary of the movie's reception
-            2. Key strengths and weaknesses identified by reviewers
-            3. Target audience and appeal
-            4. Overall recommendation and context
-            
-            Make it engaging and informative for general audiences.
+
+            ALL REVIEWS:
+            {all_reviews[:2000]}...
+
+            CRITIC REVIEWS:
+            {critic_reviews[:1500]}...
+
+            USER REVIEWS:
+            {user_reviews[:1500]}...
+
+            Produce three sections:
+            1. "review_analysis": main themes and topics, most praised and
+               most criticized aspects, overall tone, and key insights
+               about the movie's reception.
+            2. "sentiment_analysis": overall sentiment distribution,
+               differences between critic and audience sentiment, notable
+               emotional responses, and rating trends.
+            3. "summary": an engaging executive summary of the movie's
+               reception with key strengths, weaknesses, target audience
+               and an overall recommendation for general audiences.
             """,
-            expected_output="""A comprehensive summary report containing:
-            - Executive summary of movie reception (2-3 paragraphs)
-            - Key strengths identified by reviewers (3-5 points)
-            - Key weaknesses identified by reviewers (3-5 points)
-            - Target audience and appeal analysis
-            - Overall recommendation with context
-            - Engaging and accessible language for general audiences""",
+            expected_output="""A JSON object with exactly three string keys:
+            - "review_analysis": structured review analysis report
+            - "sentiment_analysis": detailed sentiment analysis report
+            - "summary": comprehensive, accessible summary of the reception""",
             agent=self.agents["summarizer"],
         )
-        tasks.append(summary_task)
 
-        return tasks
+        return [analysis_task]
 
     def _process_crew_results(
         self, results: Any, movie_data: MovieData
@@ -293,6 +610,16 @@ class MovieAnalysisCrew:
             else:
                 summary = str(results)
 
+            # The consolidated task returns one JSON object with the
+            # three analysis sections; fall back to the raw text when
+            # the model didn't honour JSON mode
+            try:
+                sections = json.loads(summary)
+            except (TypeError, ValueError):
+                sections = {}
+            if isinstance(sections, dict) and sections.get("summary"):
+                summary = sections["summary"]
+
             # Extract sentiment information
             sentiment = self._extract_sentiment_from_reviews(movie_data.reviews)
 
@@ -302,16 +629,25 @@ class MovieAnalysisCrew:
             # Extract pros and cons
             pros_cons = self._extract_pros_cons_from_reviews(movie_data.reviews)
 
-            return {
+            result = {
                 "summary": summary,
                 "sentiment": sentiment,
                 "themes": themes,
                 "pros_cons": pros_cons,
                 "total_reviews": len(movie_data.reviews),
-                "sources": list(set(review.source for review in movie_data.reviews)),
+                "sources": movie_data.sources,
                 "analysis_method": "CrewAI",
             }
 
+            # Surface the other two JSON sections when the model
+            # provided them
+            if isinstance(sections, dict):
+                for key in ("review_analysis", "sentiment_analysis"):
+                    if sections.get(key):
+                        result[key] = sections[key]
+
+            return result
+
         except Exception as e:
             logger.error(f"Error processing crew results: {e}")
             return self._fallback_analysis(movie_data)
@@ -321,8 +657,10 @@ class MovieAnalysisCrew:
 
         logger.info("Using enhanced fallback analysis method")
 
-        # Simple sentiment analysis
-        sentiment = self._extract_sentiment_from_reviews(movie_data.reviews)
+        # Classify each review once; the overall and per-type sentiment
+        # breakdowns below all derive from the same label array
+        labels = self._classify_reviews(movie_data.reviews)
+        sentiment = self._sentiment_from_labels(labels)
 
         # Extract basic themes
         themes = self._extract_themes_from_reviews(movie_data.reviews)
@@ -332,12 +670,17 @@ class MovieAnalysisCrew:
 
         # Create comprehensive summary
         total_reviews = len(movie_data.reviews)
-        sources = list(set(review.source for review in movie_data.reviews))
+        sources = movie_data.sources
         avg_rating = movie_data.get_average_rating()
 
         # Enhanced summary generation
-        critic_reviews = [r for r in movie_data.reviews if r.review_type == "critic"]
-        user_reviews = [r for r in movie_data.reviews if r.review_type == "user"]
+        is_critic = np.fromiter(
+            (r.review_type == "critic" for r in movie_data.reviews),
+            dtype=bool,
+            count=total_reviews,
+        )
+        critic_reviews = movie_data.get_reviews_by_type("critic")
+        user_reviews = movie_data.get_reviews_by_type("user")
 
         # Calculate more detailed sentiment
         positive_pct = sentiment.get("positive", 0) * 100
@@ -376,8 +719,8 @@ class MovieAnalysisCrew:
 
         # Source breakdown
         if critic_reviews and user_reviews:
-            critic_sentiment = self._extract_sentiment_from_reviews(critic_reviews)
-            user_sentiment = self._extract_sentiment_from_reviews(user_reviews)
+            critic_sentiment = self._sentiment_from_labels(labels[is_critic])
+            user_sentiment = self._sentiment_from_labels(labels[~is_critic])
 
             critic_pos = critic_sentiment.get("positive", 0) * 100
             user_pos = user_sentiment.get("positive", 0) * 100
@@ -444,159 +787,140 @@ class MovieAnalysisCrew:
             "average_rating": avg_rating,
         }
 
+    def _scan_range(
+        self,
+        reviews: List,
+        pos_counts: np.ndarray,
+        neg_counts: np.ndarray,
+        start: int,
+        end: int,
+    ) -> None:
+        """Fill keyword counts for reviews[start:end] into the shared arrays."""
+        for i in range(start, end):
+            content_lower = reviews[i].content.lower()
+
+            if _HAS_NUMBA:
+                # JIT-compiled scan over raw bytes, no interpreter overhead
+                content_arr = np.frombuffer(
+                    content_lower.encode("utf-8", "ignore"), dtype=np.uint8
+                )
+                pos_counts[i] = _count_keywords_jit(content_arr, *self.POS_TABLE)
+                neg_counts[i] = _count_keywords_jit(content_arr, *self.NEG_TABLE)
+            else:
+                # Single compiled-regex scan per polarity instead of one
+                # str.count pass per keyword
+                pos_counts[i] = len(self.POS_RE.findall(content_lower))
+                neg_counts[i] = len(self.NEG_RE.findall(content_lower))
+
+    def _classify_reviews(self, reviews: List) -> np.ndarray:
+        """Classify each review as -1 (negative), 0 (neutral) or +1 (positive)."""
+
+        n = len(reviews)
+        pos_counts = np.zeros(n, dtype=np.int32)
+        neg_counts = np.zeros(n, dtype=np.int32)
+
+        if n > self._SCAN_THRESHOLD:
+            # Large lists are scanned in parallel: each worker fills a
+            # disjoint slice and the C-level scans release the GIL
+            executor = self._get_scan_executor()
+            futures = [
+                executor.submit(
+                    self._scan_range,
+                    reviews,
+                    pos_counts,
+                    neg_counts,
+                    start,
+                    min(start + self._SCAN_CHUNK, n),
+                )
+                for start in range(0, n, self._SCAN_CHUNK)
+            ]
+            for future in futures:
+                future.result()
+        else:
+            self._scan_range(reviews, pos_counts, neg_counts, 0, n)
+
+        # Rating adjustment applied branchlessly over the whole batch;
+        # unrated reviews carry 0 and fall through both masks
+        ratings = np.fromiter(
+            (review.rating or 0.0 for review in reviews), dtype=np.float32, count=n
+        )
+        pos_counts += np.where(ratings >= 7, 2, 0).astype(np.int32)
+        neg_counts += np.where((ratings > 0) & (ratings <= 4), 2, 0).astype(np.int32)
+
+        return np.sign(pos_counts - neg_counts).astype(np.int8)
+
+    @staticmethod
+    def _sentiment_from_labels(labels: np.ndarray) -> Dict[str, float]:
+        """Aggregate per-review labels into a sentiment distribution."""
+
+        total = labels.shape[0]
+        if total == 0:
+            return {"positive": 0.0, "neutral": 0.0, "negative": 0.0}
+
+        counts = np.bincount(labels.astype(np.int64) + 1, minlength=3)
+        return {
+            "positive": float(counts[2]) / total,
+            "neutral": float(counts[1]) / total,
+            "negative": float(counts[0]) / total,
+        }
+
     def _extract_sentiment_from_reviews(self, reviews: List) -> Dict[str, float]:
         """Extract sentiment from reviews using simple heuristics."""
 
         if not reviews:
             return {"positive": 0.0, "neutral": 0.0, "negative": 0.0}
 
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-
-        positive_words = [
-            "excellent",
-            "amazing",
-            "fantastic",
-            "brilliant",
-            "outstanding",
-            "superb",
-            "wonderful",
-            "great",
-            "good",
-            "impressive",
-            "remarkable",
-            "magnificent",
-        ]
-
-        negative_words = [
-            "terrible",
-            "awful",
-            "horrible",
-            "disappointing",
-            "poor",
-            "bad",
-            "worst",
-            "pathetic",
-            "boring",
-            "dull",
-            "weak",
-            "failed",
-        ]
-
-        for review in reviews:
-            content_lower = review.content.lower()
-
-            positive_score = sum(content_lower.count(word) for word in positive_words)
-            negative_score = sum(content_lower.count(word) for word in negative_words)
-
-            # Also consider ratings if available
-            if review.rating:
-                if review.rating >= 7:
-                    positive_score += 2
-                elif review.rating <= 4:
-                    negative_score += 2
-
-            if positive_score > negative_score:
-                positive_count += 1
-            elif negative_score > positive_score:
-                negative_count += 1
-            else:
-                neutral_count += 1
-
-        total = len(reviews)
-        return {
-            "positive": positive_count / total,
-            "neutral": neutral_count / total,
-            "negative": negative_count / total,
-        }
+        return self._sentiment_from_labels(self._classify_reviews(reviews))
 
     def _extract_themes_from_reviews(self, reviews: List) -> List[str]:
         """Extract common themes from reviews."""
 
-        theme_keywords = {
-            "Acting": [
-                "acting",
-                "performance",
-                "actor",
-                "actress",
-                "cast",
-                "character",
-            ],
-            "Plot": ["plot", "story", "storyline", "narrative", "script"],
-            "Direction": ["direction", "director", "directed", "directing"],
-            "Cinematography": [
-                "cinematography",
-                "visuals",
-                "camera",
-                "shots",
-                "photography",
-            ],
-            "Music/Sound": ["music", "soundtrack", "score", "sound", "audio"],
-            "Special Effects": ["effects", "cgi", "visual effects", "special effects"],
-            "Pacing": ["pacing", "pace", "slow", "fast", "rushed", "dragged"],
-            "Entertainment": [
-                "entertaining",
-                "fun",
-                "enjoyable",
-                "engaging",
-                "thrilling",
-            ],
-        }
-
-        theme_scores = {}
         all_content = " ".join([review.content.lower() for review in reviews])
 
-        for theme, keywords in theme_keywords.items():
-            score = sum(all_content.count(keyword) for keyword in keywords)
-            if score > 0:
-                theme_scores[theme] = score
+        # One scan of the combined content; each keyword hit is bucketed
+        # into its theme
+        if _HAS_AHOCORASICK:
+            theme_scores = Counter(
+                _iter_word_matches(self.THEME_AUTOMATON, all_content)
+            )
+        else:
+            theme_scores = Counter(
+                self._KEYWORD_TO_THEME[match]
+                for match in self.THEME_RE.findall(all_content)
+            )
 
         # Return top themes
-        sorted_themes = sorted(theme_scores.items(), key=lambda x: x[1], reverse=True)
-        return [theme for theme, score in sorted_themes[:5]]
+        return [theme for theme, score in theme_scores.most_common(5)]
 
     def _extract_pros_cons_from_reviews(self, reviews: List) -> Dict[str, List[str]]:
         """Extract commonly mentioned pros and cons."""
 
-        pros_keywords = {
-            "Great acting": ["great acting", "excellent performance", "brilliant cast"],
-            "Engaging plot": [
-                "interesting story",
-                "compelling plot",
-                "engaging narrative",
-            ],
-            "Beautiful visuals": [
-                "stunning visuals",
-                "beautiful cinematography",
-                "gorgeous shots",
-            ],
-            "Good direction": [
-                "well directed",
-                "excellent direction",
-                "masterful directing",
-            ],
-            "Entertaining": ["very entertaining", "highly enjoyable", "lots of fun"],
-        }
-
-        cons_keywords = {
-            "Poor acting": ["bad acting", "poor performance", "terrible cast"],
-            "Weak plot": ["boring story", "confusing plot", "weak narrative"],
-            "Bad visuals": ["poor visuals", "bad cinematography", "ugly shots"],
-            "Poor direction": ["badly directed", "poor direction", "weak directing"],
-            "Boring": ["very boring", "not entertaining", "dull movie"],
-        }
-
         all_content = " ".join([review.content.lower() for review in reviews])
 
-        pros = []
-        for pro, keywords in pros_keywords.items():
-            if any(keyword in all_content for keyword in keywords):
-                pros.append(pro)
+        if _HAS_AHOCORASICK:
+            # One pass over the text finds every pros/cons phrase at once
+            pros_found = set(_iter_word_matches(self.PROS_AUTOMATON, all_content))
+            cons_found = set(_iter_word_matches(self.CONS_AUTOMATON, all_content))
+            pros = [pro for pro in self.PROS_KEYWORDS if pro in pros_found]
+            cons = [con for con in self.CONS_KEYWORDS if con in cons_found]
+        else:
+            # Tokenize once and check each 2-3 word phrase against a set of
+            # token n-grams instead of scanning the whole text per keyword
+            tokens = re.findall(r"[a-z0-9']+", all_content)
+            phrases = {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+            phrases.update(
+                f"{a} {b} {c}" for a, b, c in zip(tokens, tokens[1:], tokens[2:])
+            )
 
-        cons = []
-        for con, keywords in cons_keywords.items():
-            if any(keyword in all_content for keyword in keywords):
-                cons.append(con)
+            pros = [
+                pro
+                for pro, keywords in self.PROS_KEYWORDS.items()
+                if any(keyword in phrases for keyword in keywords)
+            ]
+            cons = [
+                con
+                for con, keywords in self.CONS_KEYWORDS.items()
+                if any(keyword in phrases for keyword in keywords)
+            ]
 
         return {"pros": pros[:5], "cons": cons[:5]}
@@ -4,10 +4,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewData:
     """Data model for a single movie review."""
 
@@ -20,9 +21,31 @@ class ReviewData:
     review_type: str = "user"  # "user" or "critic"
     helpful_votes: Optional[int] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
-
-
-@dataclass
+    _display_excerpt: Optional[str] = field(
+        default=None, repr=False, compare=False
+    )
+    _rating_str: Optional[str] = field(default=None, repr=False, compare=False)
+
+    @property
+    def display_excerpt(self) -> str:
+        """Content truncated to 300 characters for display, computed once."""
+        if self._display_excerpt is None:
+            self._display_excerpt = (
+                self.content
+                if len(self.content) <= 300
+                else self.content[:300] + "..."
+            )
+        return self._display_excerpt
+
+    @property
+    def rating_str(self) -> str:
+        """Rating formatted for display, computed once."""
+        if self._rating_str is None:
+            self._rating_str = "" if self.rating is None else f"{self.rating}"
+        return self._rating_str
+
+
+@dataclass(slots=True)
 class MovieData:
     """Data model for movie information and reviews."""
 
@@ -35,20 +58,74 @@ class MovieData:
     ratings: Dict[str, float] = field(default_factory=dict)  # source -> rating
     reviews: List[ReviewData] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _sources_cache: Optional[List[str]] = field(
+        default=None, repr=False, compare=False
+    )
+    _sources_count: int = field(default=-1, repr=False, compare=False)
+    _avg_rating_cache: Optional[float] = field(
+        default=None, repr=False, compare=False
+    )
+    _avg_rating_count: int = field(default=-1, repr=False, compare=False)
+    _by_type_cache: Optional[Dict[str, List[ReviewData]]] = field(
+        default=None, repr=False, compare=False
+    )
+    _by_type_count: int = field(default=-1, repr=False, compare=False)
 
     def add_review(self, review: ReviewData) -> None:
         """Add a review to the movie data."""
         self.reviews.append(review)
 
+    @property
+    def sources(self) -> List[str]:
+        """Unique review sources in first-seen order.
+
+        Cached against the review count so repeated consumers don't re-hash
+        every review; scrapers that assign ``reviews`` wholesale are picked
+        up on the next access.
+        """
+        if self._sources_cache is None or self._sources_count != len(self.reviews):
+            self._sources_cache = list(
+                dict.fromkeys(review.source for review in self.reviews)
+            )
+            self._sources_count = len(self.reviews)
+        return self._sources_cache
+
     def get_reviews_by_source(self, source: str) -> List[ReviewData]:
         """Get all reviews from a specific source."""
         return [review for review in self.reviews if review.source == source]
 
+    def get_reviews_by_type(self, review_type: str) -> List[ReviewData]:
+        """Get all reviews of a given type ("user" or "critic").
+
+        The partition is built once and revalidated against the review
+        count, so repeated critic/user lookups don't re-walk the list.
+        """
+        if self._by_type_cache is None or self._by_type_count != len(self.reviews):
+            by_type: Dict[str, List[ReviewData]] = {}
+            for review in self.reviews:
+                by_type.setdefault(review.review_type, []).append(review)
+            self._by_type_cache = by_type
+            self._by_type_count = len(self.reviews)
+        return self._by_type_cache.get(review_type, [])
+
+    @property
+    def ratings_array(self) -> np.ndarray:
+        """Ratings across all sources as a float32 NumPy array."""
+        return np.fromiter(
+            self.ratings.values(), dtype=np.float32, count=len(self.ratings)
+        )
+
     def get_average_rating(self) -> Optional[float]:
         """Calculate the average rating across all sources."""
         if not self.ratings:
             return None
-        return sum(self.ratings.values()) / len(self.ratings)
+        if (
+            self._avg_rating_cache is None
+            or self._avg_rating_count != len(self.ratings)
+        ):
+            self._avg_rating_cache = float(self.ratings_array.mean())
+            self._avg_rating_count = len(self.ratings)
+        return self._avg_rating_cache
 
 
 class MovieSearchQuery(BaseModel):
@@ -93,7 +170,7 @@ class AnalysisResult(BaseModel):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     """Result from scraping a movie source."""
 
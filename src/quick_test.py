@@ -9,32 +9,33 @@ async def quick_test():
     """Quick test of Rotten Tomatoes scraping."""
     print("Testing Rotten Tomatoes for The Matrix...")
 
-    scraper = RottenTomatoesScraper()
-
     try:
-        # Test direct URL
-        rt_url = "https://www.rottentomatoes.com/m/matrix"
-        print(f"Testing URL: {rt_url}")
-
-        # Test movie data
-        movie_data = await scraper.scrape_movie_data(rt_url)
-        print(f"Movie: {movie_data.title} ({movie_data.year})")
-        print(f"Director: {movie_data.director}")
-
-        # Test reviews
-        reviews = await scraper.scrape_reviews(rt_url, max_reviews=3)
-        print(f"Found {len(reviews)} reviews")
-
-        for i, review in enumerate(reviews, 1):
-            print(f"Review {i}: {review.content[:50]}...")
+        # One session for both requests (connection reuse), with the
+        # context manager making cleanup deterministic
+        async with RottenTomatoesScraper() as scraper:
+            # Test direct URL
+            rt_url = "https://www.rottentomatoes.com/m/matrix"
+            print(f"Testing URL: {rt_url}")
+
+            # Fetch movie data and reviews concurrently over the shared
+            # session instead of awaiting them back to back
+            movie_data, reviews = await asyncio.gather(
+                scraper.scrape_movie_data(rt_url),
+                scraper.scrape_reviews(rt_url, max_reviews=3),
+            )
+            print(f"Movie: {movie_data.title} ({movie_data.year})")
+            print(f"Director: {movie_data.director}")
+
+            print(f"Found {len(reviews)} reviews")
+
+            for i, review in enumerate(reviews, 1):
+                print(f"Review {i}: {review.content[:50]}...")
 
     except Exception as e:
         print(f"Error: {e}")
         import traceback
 
         traceback.print_exc()
-    finally:
-        await scraper.cleanup()
 
 
 if __name__ == "__main__":
@@ -2,5 +2,6 @@
 
 from .movie_rag_system import MovieRAGSystem
 from .vector_database import VectorDatabase
+from ._singleton import get_rag_system
 
-__all__ = ["VectorDatabase", "MovieRAGSystem"]
+__all__ = ["VectorDatabase", "MovieRAGSystem", "get_rag_system"]
@@ -0,0 +1,52 @@
+"""Process-wide LLM client singletons.
+
+Multiple MovieRAGSystem instances (e.g. one per web request) would each
+open their own HTTPS connection pool; sharing one client per provider
+keeps TLS sessions and keep-alive connections warm across instances.
+"""
+
+import threading
+from typing import Optional
+
+import httpx
+from groq import Groq
+from langchain_openai import ChatOpenAI
+
+_lock = threading.Lock()
+
+_groq_client: Optional[Groq] = None
+_groq_api_key: Optional[str] = None
+
+_openai_clients: dict = {}
+
+
+def _pooled_http_client() -> httpx.Client:
+    """Build an httpx client with generous keep-alive pooling."""
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+    )
+
+
+def get_groq_client(api_key: str) -> Groq:
+    """Return the shared Groq client, creating it on first use."""
+    global _groq_client, _groq_api_key
+
+    with _lock:
+        if _groq_client is None or _groq_api_key != api_key:
+            _groq_client = Groq(api_key=api_key, http_client=_pooled_http_client())
+            _groq_api_key = api_key
+        return _groq_client
+
+
+def get_chat_openai(model_name: str, api_key: str, **kwargs) -> ChatOpenAI:
+    """Return a shared ChatOpenAI instance for the model/key pair."""
+    cache_key = (model_name, api_key)
+
+    with _lock:
+        client = _openai_clients.get(cache_key)
+        if client is None:
+            client = ChatOpenAI(
+                model_name=model_name, openai_api_key=api_key, **kwargs
+            )
+            _openai_clients[cache_key] = client
+        return client
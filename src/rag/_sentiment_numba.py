@@ -0,0 +1,41 @@
+"""Optional Numba kernel for sentiment rating bucketing."""
+
+# Numba fuses the bucket/accumulate into one native-code pass; callers
+# fall back to the vectorized numpy version when it isn't installed.
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    njit = None
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True, fastmath=True)
+    def bucket_ratings(ratings):  # pragma: no cover
+        """Bucket a float ratings array in a single fused pass.
+
+        Returns ``(positive, negative, neutral, rating_sum, rated)``
+        using the same thresholds as the numpy path: >= 7 positive,
+        (0, 4] negative, unrated entries are 0.
+        """
+        positive = 0
+        negative = 0
+        rated = 0
+        rating_sum = 0.0
+        for i in range(ratings.shape[0]):
+            rating = ratings[i]
+            if rating > 0:
+                rated += 1
+                rating_sum += rating
+                if rating >= 7:
+                    positive += 1
+                elif rating <= 4:
+                    negative += 1
+        neutral = ratings.shape[0] - positive - negative
+        return positive, negative, neutral, rating_sum, rated
+
+else:
+    bucket_ratings = None
@@ -0,0 +1,20 @@
+"""Process-wide singleton access to the Movie RAG System."""
+
+import functools
+
+from rag.movie_rag_system import MovieRAGSystem
+
+
+@functools.lru_cache(maxsize=2)
+def get_rag_system(lightweight: bool = False) -> MovieRAGSystem:
+    """Get a cached MovieRAGSystem instance for this process.
+
+    Mirrors the @st.cache_resource pattern used in the Streamlit app so that
+    CLI commands and scripts sharing a process don't re-initialize the
+    embedding model and LLM clients on every call.
+
+    Args:
+        lightweight: Skip LLM initialization for commands that only need
+            database metadata (e.g. listing movies or showing stats).
+    """
+    return MovieRAGSystem(lightweight=lightweight)
@@ -1,33 +1,88 @@
 """Main RAG system for movie reviews."""
 
 import asyncio
+import functools
+import hashlib
+import io
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Final, Iterator, List, Optional, Tuple
 
+import numpy as np
 from groq import Groq
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 
 from models.movie_data import MovieData, RAGQuery, RAGResponse
+from rag._llm_clients import get_chat_openai, get_groq_client
+from rag._sentiment_numba import bucket_ratings
 from rag.vector_database import VectorDatabase
 from scrapers.scraper_manager import ScraperManager, ScrapingConfig
 
 logger = logging.getLogger(__name__)
 
+# The system prompt never varies per query, so it is built once at import
+# time along with the message objects both LLM backends reuse verbatim
+_SYSTEM_PROMPT: Final[str] = """
+You are a knowledgeable movie expert assistant powered by advanced AI. You help users understand movies based on reviews and information from multiple sources including Rotten Tomatoes, IMDB, and Metacritic.
+
+Guidelines:
+- Provide comprehensive, balanced answers based on the provided context
+- Cite specific sources when mentioning opinions or ratings
+- Distinguish between critic and audience opinions when relevant
+- If asked about specific aspects (acting, plot, cinematography), focus on those areas
+- Be objective and present different perspectives when they exist
+- If the context doesn't contain enough information, say so honestly
+- Use your expertise to provide insightful analysis while staying grounded in the provided data
+
+Always base your response on the provided context and avoid making up information.
+"""
+
+_SYSTEM_MESSAGE_DICT: Final[Dict[str, str]] = {
+    "role": "system",
+    "content": _SYSTEM_PROMPT,
+}
+_SYSTEM_MESSAGE: Final[SystemMessage] = SystemMessage(content=_SYSTEM_PROMPT)
+
 
 class MovieRAGSystem:
     """Complete RAG system for movie review analysis and querying."""
 
-    def __init__(self, db_path: str = None):
+    # Response-cache tuning: exact tier is a plain LRU, semantic tier
+    # matches near-duplicate questions by embedding similarity
+    _RESPONSE_CACHE_SIZE = 1024
+    _SEM_CACHE_TTL = 300.0
+    _SEM_SIMILARITY_THRESHOLD = 0.95
+
+    def __init__(self, db_path: str = None, lightweight: bool = False):
         self.db_path = db_path or os.getenv("CHROMA_DB_PATH", "./data/chroma_db")
         self.vector_db = VectorDatabase(self.db_path)
         self.llm = None
         self.llm_type = None
         self.model_name = None
-        self._initialize_llm_with_config()
+        if not lightweight:
+            # Skippable for metadata-only usage (listing movies, stats)
+            self._initialize_llm_with_config()
         self.scraper_manager = None
+        # Per-instance memoized query: repeated questions skip retrieval
+        # and LLM generation entirely
+        self.query_cached = functools.lru_cache(maxsize=256)(self.query)
+        # Two-tier response cache: exact-match hash lookups first, then a
+        # semantic tier keyed on the question embedding so near-duplicate
+        # phrasings ("is it good?" vs "was it good?") also skip the LLM
+        self._exact_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._sem_cache: List[Tuple[str, np.ndarray, str, float]] = []
+        # Cached vectors stacked into one float32 matrix so a lookup is a
+        # single BLAS matrix-vector product, not a per-entry np.dot loop
+        self._sem_matrix: Optional[np.ndarray] = None
+        # Write queue for add_movie_data_async/flush
+        self._pending_movies: List[MovieData] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
 
     def _initialize_llm_with_config(self):
         """Initialize the language model and store configuration."""
@@ -40,15 +95,15 @@ class MovieRAGSystem:
 
             if groq_api_key:
                 logger.info(f"Using Groq API for LLM with model: {groq_model}")
-                self.llm = Groq(api_key=groq_api_key)
+                self.llm = get_groq_client(groq_api_key)
                 self.llm_type = "groq"
                 self.model_name = groq_model
             elif openai_api_key:
                 logger.info(f"Using OpenAI API for LLM with model: {openai_model}")
-                self.llm = ChatOpenAI(
+                self.llm = get_chat_openai(
+                    openai_model,
+                    openai_api_key,
                     temperature=0.1,
-                    model_name=openai_model,
-                    openai_api_key=openai_api_key,
                     max_tokens=1000,
                 )
                 self.llm_type = "openai"
@@ -97,10 +152,8 @@ class MovieRAGSystem:
     def add_movie_data(self, movie_data: MovieData) -> None:
         """Add movie data to the vector database."""
         try:
-            # Check if movie already exists
-            existing_movies = self.vector_db.get_movies_list()
-
-            if movie_data.title in existing_movies:
+            # Check if movie already exists (O(1) lookup, no full scan)
+            if self.vector_db.has_movie(movie_data.title):
                 logger.info(
                     f"Movie '{movie_data.title}' already exists. Updating data."
                 )
@@ -114,6 +167,159 @@ class MovieRAGSystem:
             logger.error(f"Error adding movie data: {e}")
             raise
 
+    def add_movies_bulk(self, movies: List[MovieData]) -> None:
+        """Add multiple movies to the vector database in one batched write."""
+        try:
+            # Check for existing movies first
+            for movie_data in movies:
+                if self.vector_db.has_movie(movie_data.title):
+                    logger.info(
+                        f"Movie '{movie_data.title}' already exists. Updating data."
+                    )
+                    self.vector_db.delete_movie(movie_data.title)
+
+            # Single embedding pass + single collection write for all movies
+            self.vector_db.add_movies_bulk(movies)
+            logger.info(f"Successfully added {len(movies)} movies to database")
+
+        except Exception as e:
+            logger.error(f"Error bulk-adding movie data: {e}")
+            raise
+
+    async def add_movie_data_threaded(self, movie_data: MovieData) -> None:
+        """Add a movie without blocking the event loop.
+
+        The embedding calls inside Chroma are blocking I/O; running them
+        on a worker thread lets async callers keep scraping the next
+        movie while the previous one embeds.
+        """
+        await asyncio.to_thread(self.add_movie_data, movie_data)
+
+    def add_movie_data_async(self, movie_data: MovieData) -> None:
+        """Queue a movie for a batched write to the vector database.
+
+        Writes are flushed in one batch shortly after the last enqueue (or
+        explicitly via flush), amortizing Chroma's per-write overhead when
+        several movies are added in quick succession.
+        """
+        with self._pending_lock:
+            self._pending_movies.append(movie_data)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(1.0, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write any queued movies to the vector database in one batch."""
+        with self._pending_lock:
+            pending, self._pending_movies = self._pending_movies, []
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+        if pending:
+            self.add_movies_bulk(pending)
+
+    def _embed_question(self, question: str) -> Optional[np.ndarray]:
+        """Embed a question for the semantic cache tier.
+
+        Goes through the vector database's LRU-cached query embedding so
+        the same question is embedded once across the response cache and
+        retrieval. Returns a unit-normalized float32 vector, or None
+        when the embedding function is unavailable (the caches then
+        degrade to exact matching only).
+        """
+        try:
+            vector = self.vector_db._query_embedding(question)
+            if vector is None:
+                return None
+            vec = np.asarray(vector, dtype=np.float32)
+            norm = float(np.linalg.norm(vec))
+            if norm == 0.0:
+                return None
+            return vec / norm
+        except Exception as e:
+            logger.debug(f"Question embedding for semantic cache failed: {e}")
+            return None
+
+    def _response_cache_lookup(
+        self, cache_key: str, question: str, scope: str
+    ) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """Check the exact tier, then the semantic tier, for a response.
+
+        Returns the cached response (or None) together with the question
+        vector, which is only computed after the exact tier misses so
+        exact repeats never pay for an embedding pass; callers hand the
+        vector back to _response_cache_store.
+        """
+        now = time.monotonic()
+
+        entry = self._exact_cache.get(cache_key)
+        if entry is not None:
+            response, stamp = entry
+            if now - stamp <= self._SEM_CACHE_TTL:
+                self._exact_cache.move_to_end(cache_key)
+                return response, None
+            del self._exact_cache[cache_key]
+
+        question_vec = self._embed_question(question)
+        if question_vec is None:
+            return None, None
+
+        # Drop expired semantic entries, then take the best match within
+        # the same movie/max_results scope (vectors are unit-normalized,
+        # so the dot product is the cosine similarity)
+        live = [
+            entry for entry in self._sem_cache if now - entry[3] <= self._SEM_CACHE_TTL
+        ]
+        if len(live) != len(self._sem_cache):
+            self._sem_cache = live
+            self._sem_matrix = None
+        if not self._sem_cache:
+            return None, question_vec
+
+        # All similarities in one matrix-vector product over the stacked
+        # float32 vectors instead of a per-entry np.dot loop
+        if self._sem_matrix is None or self._sem_matrix.shape[0] != len(
+            self._sem_cache
+        ):
+            self._sem_matrix = np.stack(
+                [entry[1] for entry in self._sem_cache]
+            ).astype(np.float32, copy=False)
+        similarities = self._sem_matrix @ question_vec
+
+        best_response = None
+        best_similarity = self._SEM_SIMILARITY_THRESHOLD
+        for (entry_scope, _, response, _), similarity in zip(
+            self._sem_cache, similarities
+        ):
+            if entry_scope != scope:
+                continue
+            if similarity >= best_similarity:
+                best_similarity = float(similarity)
+                best_response = response
+        return best_response, question_vec
+
+    def _response_cache_store(
+        self,
+        cache_key: str,
+        question_vec: Optional[np.ndarray],
+        scope: str,
+        response: str,
+    ) -> None:
+        """Populate both cache tiers after a generated response."""
+        now = time.monotonic()
+
+        self._exact_cache[cache_key] = (response, now)
+        while len(self._exact_cache) > self._RESPONSE_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
+
+        if question_vec is not None:
+            self._sem_cache.append((scope, question_vec, response, now))
+            if len(self._sem_cache) > self._RESPONSE_CACHE_SIZE:
+                del self._sem_cache[: -self._RESPONSE_CACHE_SIZE]
+            self._sem_matrix = None  # Restacked lazily on next lookup
+
     def query(
         self,
         question: str,
@@ -123,26 +329,42 @@ class MovieRAGSystem:
     ) -> str:
         """Query the RAG system with a question about movies."""
 
+        # Short-circuit on a cached response before touching retrieval
+        # or the LLM; near-duplicate phrasings hit the semantic tier
+        normalized = " ".join(question.lower().split())
+        scope = f"{movie_title}|{max_results}|{similarity_threshold}"
+        cache_key = hashlib.sha256(
+            f"{normalized}|{scope}".encode("utf-8")
+        ).hexdigest()
+
+        cached, question_vec = self._response_cache_lookup(cache_key, question, scope)
+        if cached is not None:
+            return cached
+
         try:
             # Retrieve relevant documents
             relevant_docs = self.vector_db.query(
                 query_text=question, movie_title=movie_title, n_results=max_results
             )
 
-            # Filter by similarity threshold
-            print(
-                f"DEBUG: Filtering {len(relevant_docs)} docs with threshold {similarity_threshold}"
-            )
-            for i, doc in enumerate(relevant_docs):
-                print(f"DEBUG: Doc {i+1} score: {doc['relevance_score']:.4f}")
+            # Filter by similarity threshold; per-doc diagnostics are
+            # %-formatted lazily so a disabled DEBUG level costs nothing
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Filtering %d docs with threshold %s",
+                    len(relevant_docs),
+                    similarity_threshold,
+                )
+                for i, doc in enumerate(relevant_docs):
+                    logger.debug("Doc %d score: %.4f", i + 1, doc.relevance_score)
 
             filtered_docs = [
                 doc
                 for doc in relevant_docs
-                if doc["relevance_score"] >= similarity_threshold
+                if doc.relevance_score >= similarity_threshold
             ]
 
-            print(f"DEBUG: After filtering: {len(filtered_docs)} docs remain")
+            logger.debug("After filtering: %d docs remain", len(filtered_docs))
 
             if not filtered_docs:
                 return self._generate_no_results_response(question, movie_title)
@@ -150,65 +372,162 @@ class MovieRAGSystem:
             # Generate response using LLM
             response = self._generate_llm_response(question, filtered_docs, movie_title)
 
+            self._response_cache_store(cache_key, question_vec, scope, response)
+
             return response
 
         except Exception as e:
             logger.error(f"Error processing query: {e}")
             return f"Sorry, I encountered an error while processing your question: {str(e)}"
 
-    def _generate_llm_response(
+    def query_stream(
+        self,
+        question: str,
+        movie_title: Optional[str] = None,
+        max_results: int = 5,
+        similarity_threshold: float = 0.1,
+    ) -> Iterator[str]:
+        """Stream the answer to a question as the LLM produces it.
+
+        Mirrors query but yields response fragments incrementally, so
+        callers can render partial output instead of waiting for the
+        full completion. Cache hits, no-result messages and the non-LLM
+        fallback are yielded as a single chunk. The assembled response
+        is stored in the response cache once the stream completes.
+        """
+        normalized = " ".join(question.lower().split())
+        scope = f"{movie_title}|{max_results}|{similarity_threshold}"
+        cache_key = hashlib.sha256(
+            f"{normalized}|{scope}".encode("utf-8")
+        ).hexdigest()
+
+        cached, question_vec = self._response_cache_lookup(cache_key, question, scope)
+        if cached is not None:
+            yield cached
+            return
+
+        try:
+            relevant_docs = self.vector_db.query(
+                query_text=question, movie_title=movie_title, n_results=max_results
+            )
+
+            filtered_docs = [
+                doc
+                for doc in relevant_docs
+                if doc.relevance_score >= similarity_threshold
+            ]
+
+            if not filtered_docs:
+                yield self._generate_no_results_response(question, movie_title)
+                return
+
+            parts: List[str] = []
+            for fragment in self._stream_llm_response(
+                question, filtered_docs, movie_title
+            ):
+                parts.append(fragment)
+                yield fragment
+
+            self._response_cache_store(
+                cache_key, question_vec, scope, "".join(parts)
+            )
+
+        except Exception as e:
+            logger.error(f"Error processing streaming query: {e}")
+            yield f"Sorry, I encountered an error while processing your question: {str(e)}"
+
+    def _stream_llm_response(
         self,
         question: str,
         relevant_docs: List[Dict[str, Any]],
         movie_title: Optional[str] = None,
-    ) -> str:
-        """Generate a response using the LLM with retrieved context."""
+    ) -> Iterator[str]:
+        """Yield LLM response fragments for the retrieved context."""
 
         if not self.llm:
-            return self._generate_fallback_response(
+            yield self._generate_fallback_response(
                 question, relevant_docs, movie_title
             )
+            return
 
         try:
-            # Prepare context from retrieved documents
-            context_parts = []
-
-            for i, doc in enumerate(relevant_docs[:5]):  # Limit to top 5 results
-                metadata = doc["metadata"]
-                content = doc["content"]
-
-                if metadata.get("type") == "overview":
-                    context_parts.append(f"Movie Overview: {content}")
-                else:
-                    author = metadata.get("author", "Anonymous")
-                    source = metadata.get("source", "Unknown")
-                    rating = metadata.get("rating", "N/A")
-
-                    context_parts.append(
-                        f"Review by {author} from {source} (Rating: {rating}): {content[:500]}..."
-                    )
+            user_prompt = self._build_user_prompt(
+                question, relevant_docs, movie_title
+            )
 
-            context = "\n\n".join(context_parts)
+            if self.llm_type == "groq":
+                completion = self.llm.chat.completions.create(
+                    model=self.model_name,
+                    messages=[
+                        _SYSTEM_MESSAGE_DICT,
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=0.1,
+                    max_tokens=1000,
+                    top_p=1,
+                    stream=True,
+                    stop=None,
+                )
+                for chunk in completion:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        yield delta
 
-            # Create system prompt
-            system_prompt = """
-You are a knowledgeable movie expert assistant powered by advanced AI. You help users understand movies based on reviews and information from multiple sources including Rotten Tomatoes, IMDB, and Metacritic.
+            elif self.llm_type == "openai":
+                human_message = HumanMessage(content=user_prompt)
+                for chunk in self.llm.stream([_SYSTEM_MESSAGE, human_message]):
+                    if chunk.content:
+                        yield chunk.content
 
-Guidelines:
-- Provide comprehensive, balanced answers based on the provided context
-- Cite specific sources when mentioning opinions or ratings
-- Distinguish between critic and audience opinions when relevant
-- If asked about specific aspects (acting, plot, cinematography), focus on those areas
-- Be objective and present different perspectives when they exist
-- If the context doesn't contain enough information, say so honestly
-- Use your expertise to provide insightful analysis while staying grounded in the provided data
+            else:
+                yield self._generate_fallback_response(
+                    question, relevant_docs, movie_title
+                )
 
-Always base your response on the provided context and avoid making up information.
-"""
+        except Exception as e:
+            logger.error(f"Error streaming LLM response: {e}")
+            yield self._generate_fallback_response(
+                question, relevant_docs, movie_title
+            )
 
-            movie_context = f" about the movie '{movie_title}'" if movie_title else ""
+    def _build_user_prompt(
+        self,
+        question: str,
+        relevant_docs: List[Dict[str, Any]],
+        movie_title: Optional[str] = None,
+    ) -> str:
+        """Build the user prompt from the retrieved documents."""
+
+        # Prepare context from retrieved documents, streamed into one
+        # buffer instead of a list of f-strings plus a join pass
+        buf = io.StringIO()
+
+        for doc in relevant_docs[:5]:  # Limit to top 5 results
+            metadata = doc.metadata
+            content = doc.content
+
+            if buf.tell():
+                buf.write("\n\n")
+
+            if metadata.get("type") == "overview":
+                buf.write("Movie Overview: ")
+                buf.write(content)
+            else:
+                author = metadata.get("author", "Anonymous")
+                source = metadata.get("source", "Unknown")
+                rating = metadata.get("rating", "N/A")
+
+                buf.write(f"Review by {author} from {source} (Rating: {rating}): ")
+                # Cap by bytes rather than characters: one slice on
+                # the encoded form, cheap for ASCII-heavy reviews
+                buf.write(content.encode("utf-8")[:500].decode("utf-8", "ignore"))
+                buf.write("...")
 
-            user_prompt = f"""
+        context = buf.getvalue()
+
+        movie_context = f" about the movie '{movie_title}'" if movie_title else ""
+
+        user_prompt = f"""
 Based on the following movie reviews and information, please answer this question{movie_context}:
 
 Question: {question}
@@ -219,13 +538,33 @@ Context:
 Please provide a comprehensive answer based on the available information.
 """
 
+        return user_prompt
+
+    def _generate_llm_response(
+        self,
+        question: str,
+        relevant_docs: List[Dict[str, Any]],
+        movie_title: Optional[str] = None,
+    ) -> str:
+        """Generate a response using the LLM with retrieved context."""
+
+        if not self.llm:
+            return self._generate_fallback_response(
+                question, relevant_docs, movie_title
+            )
+
+        try:
+            user_prompt = self._build_user_prompt(
+                question, relevant_docs, movie_title
+            )
+
             # Check if using Groq or OpenAI
             if self.llm_type == "groq":
                 # Use Groq API with configured model
                 completion = self.llm.chat.completions.create(
                     model=self.model_name,
                     messages=[
-                        {"role": "system", "content": system_prompt},
+                        _SYSTEM_MESSAGE_DICT,
                         {"role": "user", "content": user_prompt},
                     ],
                     temperature=0.1,
@@ -239,9 +578,8 @@ Please provide a comprehensive answer based on the available information.
 
             elif self.llm_type == "openai":
                 # Use OpenAI/LangChain
-                system_message = SystemMessage(content=system_prompt)
                 human_message = HumanMessage(content=user_prompt)
-                response = self.llm([system_message, human_message])
+                response = self.llm([_SYSTEM_MESSAGE, human_message])
                 return response.content.strip()
             else:
                 # Fallback to basic response
@@ -277,8 +615,8 @@ Please provide a comprehensive answer based on the available information.
             response_parts.append("Based on available movie reviews and information:")
 
         for doc in relevant_docs[:3]:  # Show top 3 results
-            metadata = doc["metadata"]
-            content = doc["content"]
+            metadata = doc.metadata
+            content = doc.content
 
             if metadata.get("type") == "overview":
                 response_parts.append(f"\nMovie Information: {content}")
@@ -341,32 +679,35 @@ Please provide a comprehensive answer based on the available information.
             if not reviews:
                 return {"error": "No reviews found for this movie"}
 
-            # Simple sentiment analysis based on ratings
-            positive_count = 0
-            negative_count = 0
-            neutral_count = 0
-            total_rating = 0
-            rated_reviews = 0
-
-            for review in reviews:
-                metadata = review["metadata"]
-                rating = metadata.get("rating", 0)
-
-                if rating > 0:
-                    total_rating += rating
-                    rated_reviews += 1
-
-                    if rating >= 7:
-                        positive_count += 1
-                    elif rating <= 4:
-                        negative_count += 1
-                    else:
-                        neutral_count += 1
-                else:
-                    neutral_count += 1
+            # Simple sentiment analysis based on ratings, aggregated in one
+            # vectorized NumPy pass instead of a per-review Python loop
+            ratings = np.fromiter(
+                (review["metadata"].get("rating", 0) or 0 for review in reviews),
+                dtype=np.float32,
+                count=len(reviews),
+            )
 
             total_reviews = len(reviews)
-            avg_rating = total_rating / rated_reviews if rated_reviews > 0 else 0
+
+            if bucket_ratings is not None:
+                # Numba kernel: one fused pass with no intermediate masks
+                (
+                    positive_count,
+                    negative_count,
+                    neutral_count,
+                    rating_sum,
+                    rated_reviews,
+                ) = bucket_ratings(ratings)
+                avg_rating = rating_sum / rated_reviews if rated_reviews > 0 else 0
+            else:
+                rated_mask = ratings > 0
+                rated_reviews = int(np.count_nonzero(rated_mask))
+                positive_count = int(np.count_nonzero(ratings >= 7))
+                negative_count = int(np.count_nonzero(rated_mask & (ratings <= 4)))
+                neutral_count = total_reviews - positive_count - negative_count
+                avg_rating = (
+                    float(ratings[rated_mask].mean()) if rated_reviews > 0 else 0
+                )
 
             return {
                 "total_reviews": total_reviews,
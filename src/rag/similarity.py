@@ -0,0 +1,90 @@
+"""Client-side vector similarity helpers."""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# SimSIMD provides SIMD-accelerated (AVX2/NEON) distance kernels; fall back
+# to NumPy when it isn't installed.
+try:
+    import simsimd
+
+    _HAS_SIMSIMD = True
+except ImportError:
+    simsimd = None
+    _HAS_SIMSIMD = False
+
+
+def cosine_distances(query_vec: np.ndarray, corpus: np.ndarray) -> np.ndarray:
+    """Compute cosine distances between one query vector and a corpus matrix."""
+    query_vec = np.ascontiguousarray(query_vec, dtype=np.float32)
+    corpus = np.ascontiguousarray(corpus, dtype=np.float32)
+
+    if _HAS_SIMSIMD:
+        distances = simsimd.cdist(query_vec[None, :], corpus, metric="cosine")
+        return np.asarray(distances, dtype=np.float32).ravel()
+
+    # NumPy fallback: one BLAS-backed matrix-vector product
+    corpus_norms = np.linalg.norm(corpus, axis=1)
+    query_norm = np.linalg.norm(query_vec)
+    denom = corpus_norms * query_norm
+    denom[denom == 0] = 1.0
+    return (1.0 - (corpus @ query_vec) / denom).astype(np.float32)
+
+
+def quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Quantize float vectors to int8 with a symmetric per-vector scale.
+
+    Returns (quantized, scales) where ``quantized * scales[:, None]``
+    approximately reconstructs the input. Int8 storage is 4x smaller than
+    FP32 and SimSIMD can compute cosine on int8 directly.
+    """
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    scales = np.abs(vectors).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    quantized = np.clip(
+        np.rint(vectors / scales[:, None]), -127, 127
+    ).astype(np.int8)
+    return quantized, scales
+
+
+def cosine_distances_int8(query_vec: np.ndarray, corpus: np.ndarray) -> np.ndarray:
+    """Cosine distances between an int8 query vector and an int8 corpus.
+
+    Per-vector symmetric scales cancel out of the cosine, so quantized
+    vectors can be compared directly without dequantizing.
+    """
+    query_vec = np.ascontiguousarray(query_vec, dtype=np.int8)
+    corpus = np.ascontiguousarray(np.atleast_2d(corpus), dtype=np.int8)
+
+    if _HAS_SIMSIMD:
+        distances = simsimd.cdist(query_vec[None, :], corpus, metric="cosine")
+        return np.asarray(distances, dtype=np.float32).ravel()
+
+    # NumPy fallback: widen to int32 for the dot products, then normalize
+    query_i32 = query_vec.astype(np.int32)
+    corpus_i32 = corpus.astype(np.int32)
+    corpus_norms = np.sqrt((corpus_i32 * corpus_i32).sum(axis=1, dtype=np.int64))
+    query_norm = np.sqrt(np.dot(query_i32, query_i32))
+    denom = corpus_norms * query_norm
+    denom[denom == 0] = 1.0
+    return (1.0 - (corpus_i32 @ query_i32) / denom).astype(np.float32)
+
+
+def cosine_top_k(
+    query_vec: np.ndarray, corpus: np.ndarray, k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Return (indices, distances) of the k nearest corpus rows to query_vec."""
+    distances = cosine_distances(query_vec, corpus)
+
+    k = min(k, distances.shape[0])
+    if k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+    # argpartition avoids a full sort of the corpus
+    top = np.argpartition(distances, k - 1)[:k]
+    order = top[np.argsort(distances[top])]
+    return order, distances[order]
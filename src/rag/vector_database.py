@@ -1,8 +1,13 @@
 """Vector database manager using ChromaDB."""
 
+import hashlib
+import json
 import logging
 import os
+import threading
 import uuid
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -15,13 +20,40 @@ from models.movie_data import MovieData, ReviewData
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True, frozen=True)
+class QueryResult:
+    """One retrieved document with its relevance scores.
+
+    Slotted and frozen: far lighter than a per-row dict when callers
+    request large n_results for reranking, and hashable for caching.
+    """
+
+    content: str
+    metadata: Dict[str, Any]
+    relevance_score: float
+    distance: float
+
+
 class VectorDatabase:
     """Vector database for storing and retrieving movie review embeddings."""
 
+    # LRU cap for cached query-text embeddings
+    _EMB_CACHE_SIZE = 4096
+
     def __init__(self, db_path: str = "./data/chroma_db"):
         self.db_path = db_path
         self.client = None
         self.collection = None
+        # Lazily-built set of movie titles; kept in sync on add/delete so
+        # existence checks and listings avoid re-scanning the collection
+        self._movies_cache: Optional[set] = None
+        # Query-text embeddings keyed on content hash: repeated questions
+        # skip the embedding model/API entirely
+        self._emb_cache: "OrderedDict[bytes, list]" = OrderedDict()
+        # Maintained movie/review/source counters backing get_stats,
+        # persisted to a sidecar so restarts skip the initial scan
+        self._stats_path = os.path.join(db_path, "stats.json")
+        self._stats: Optional[Dict[str, Any]] = self._load_stats_sidecar()
 
         # Ensure database directory exists
         os.makedirs(db_path, exist_ok=True)
@@ -45,7 +77,7 @@ class VectorDatabase:
                     "Using default sentence transformer embeddings for vector database"
                 )
                 # Fallback to default sentence transformer
-                embedding_function = embedding_functions.DefaultEmbeddingFunction()
+                embedding_function = self._default_embedding_function()
 
             # Initialize client
             self.client = chromadb.PersistentClient(
@@ -66,69 +98,155 @@ class VectorDatabase:
             logger.error(f"Failed to initialize vector database: {e}")
             raise
 
+    @staticmethod
+    def _default_embedding_function():
+        """Build the local embedding function, on an accelerator if available.
+
+        The default MiniLM model runs through onnxruntime; prefer its CUDA
+        provider when one is installed so batched encodes during ingest run
+        on GPU instead of CPU.
+        """
+        try:
+            import onnxruntime
+
+            if "CUDAExecutionProvider" in onnxruntime.get_available_providers():
+                logger.info("Using CUDA execution provider for embeddings")
+                return embedding_functions.ONNXMiniLM_L6_V2(
+                    preferred_providers=[
+                        "CUDAExecutionProvider",
+                        "CPUExecutionProvider",
+                    ]
+                )
+        except Exception as e:
+            logger.debug(f"Accelerated embedding provider unavailable: {e}")
+
+        return embedding_functions.DefaultEmbeddingFunction()
+
     def add_movie_data(self, movie_data: MovieData) -> None:
         """Add movie data to the vector database."""
+        try:
+            documents, metadatas, ids = self._build_movie_payload(movie_data)
+
+            # Add to collection
+            if documents:
+                self.collection.add(documents=documents, metadatas=metadatas, ids=ids)
+
+                if self._movies_cache is not None:
+                    self._movies_cache.add(movie_data.title)
+                self._stats_record_add(metadatas)
+
+                logger.info(
+                    f"Added {len(documents)} documents for '{movie_data.title}'"
+                )
+
+        except Exception as e:
+            logger.error(f"Error adding movie data to vector database: {e}")
+            raise
+
+    def add_movies_bulk(self, movies: List[MovieData]) -> None:
+        """Add multiple movies to the database in a single batched write."""
         try:
             documents = []
             metadatas = []
             ids = []
 
-            # Add movie overview document
-            overview_text = self._create_movie_overview(movie_data)
-            documents.append(overview_text)
-
-            # Safely handle genre - convert list to string if needed
-            genre_str = movie_data.genre or ""
-            if isinstance(genre_str, list):
-                genre_str = ", ".join(genre_str)
-
-            metadatas.append(
-                {
-                    "movie_title": movie_data.title,
-                    "year": movie_data.year or 0,
-                    "director": movie_data.director or "",
-                    "genre": genre_str,
-                    "type": "overview",
-                    "source": "combined",
-                    "date_added": datetime.now().isoformat(),
-                }
-            )
-            ids.append(f"movie_overview_{movie_data.title}_{uuid.uuid4().hex[:8]}")
-
-            # Add individual reviews
-            for review in movie_data.reviews:
-                if len(review.content.strip()) < 20:  # Skip very short reviews
-                    continue
-
-                documents.append(review.content)
-                metadatas.append(
-                    {
-                        "movie_title": movie_data.title,
-                        "year": movie_data.year or 0,
-                        "author": review.author or "",
-                        "source": review.source,
-                        "rating": review.rating or 0.0,
-                        "review_type": review.review_type,
-                        "type": "review",
-                        "date_added": datetime.now().isoformat(),
-                        "review_date": review.date.isoformat() if review.date else "",
-                        "helpful_votes": review.helpful_votes or 0,
-                    }
+            now_iso = datetime.now().isoformat()
+            for movie_data in movies:
+                movie_docs, movie_metas, movie_ids = self._build_movie_payload(
+                    movie_data, now_iso=now_iso
                 )
-                ids.append(f"review_{movie_data.title}_{uuid.uuid4().hex[:8]}")
+                documents.extend(movie_docs)
+                metadatas.extend(movie_metas)
+                ids.extend(movie_ids)
 
-            # Add to collection
+            # One embedding pass and one collection write for all movies
             if documents:
                 self.collection.add(documents=documents, metadatas=metadatas, ids=ids)
 
+                if self._movies_cache is not None:
+                    self._movies_cache.update(movie.title for movie in movies)
+                self._stats_record_add(metadatas)
+
                 logger.info(
-                    f"Added {len(documents)} documents for '{movie_data.title}'"
+                    f"Added {len(documents)} documents for {len(movies)} movies"
                 )
 
         except Exception as e:
-            logger.error(f"Error adding movie data to vector database: {e}")
+            logger.error(f"Error bulk-adding movie data to vector database: {e}")
             raise
 
+    def _build_movie_payload(
+        self, movie_data: MovieData, now_iso: Optional[str] = None
+    ) -> tuple:
+        """Build the documents/metadatas/ids payload for a single movie."""
+        # Loop-invariant values computed once: a single timestamp and a
+        # single random ID base instead of one datetime/RNG call per review
+        # (bulk ingest passes a shared timestamp for the whole batch)
+        title = movie_data.title
+        year = movie_data.year or 0
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+        id_base = uuid.uuid4().hex[:8]
+        review_key = f"{title}|review"
+
+        # Pre-size for the common case of no skipped reviews and
+        # index-assign instead of amortized appends
+        size = len(movie_data.reviews) + 1
+        documents = [None] * size
+        metadatas = [None] * size
+        ids = [None] * size
+
+        # Safely handle genre - convert list to string if needed
+        genre_str = movie_data.genre or ""
+        if isinstance(genre_str, list):
+            genre_str = ", ".join(genre_str)
+
+        # Movie overview document
+        documents[0] = self._create_movie_overview(movie_data)
+        metadatas[0] = {
+            "movie_title": title,
+            "year": year,
+            "director": movie_data.director or "",
+            "genre": genre_str,
+            "type": "overview",
+            "source": "combined",
+            # Single-equality key so title+type filters avoid Chroma's
+            # slower $and path
+            "composite_key": f"{title}|overview",
+            "date_added": now_iso,
+        }
+        ids[0] = f"movie_overview_{title}_{id_base}"
+
+        # Individual reviews
+        count = 1
+        for i, review in enumerate(movie_data.reviews):
+            if len(review.content.strip()) < 20:  # Skip very short reviews
+                continue
+
+            documents[count] = review.content
+            metadatas[count] = {
+                "movie_title": title,
+                "year": year,
+                "author": review.author or "",
+                "source": review.source,
+                "rating": review.rating or 0.0,
+                "review_type": review.review_type,
+                "type": "review",
+                "composite_key": review_key,
+                "date_added": now_iso,
+                "review_date": review.date.isoformat() if review.date else "",
+                "helpful_votes": review.helpful_votes or 0,
+            }
+            ids[count] = f"review_{title}_{id_base}_{i}"
+            count += 1
+
+        if count != size:  # Trim slots left by skipped reviews
+            del documents[count:]
+            del metadatas[count:]
+            del ids[count:]
+
+        return documents, metadatas, ids
+
     def _create_movie_overview(self, movie_data: MovieData) -> str:
         """Create a comprehensive overview text for the movie."""
         overview_parts = [f"Movie: {movie_data.title}"]
@@ -149,58 +267,95 @@ class VectorDatabase:
             overview_parts.append(f"Plot: {movie_data.plot_summary}")
 
         if movie_data.ratings:
-            ratings_text = []
-            for source, rating in movie_data.ratings.items():
-                ratings_text.append(f"{source}: {rating}")
-            overview_parts.append(f"Ratings: {', '.join(ratings_text)}")
+            ratings_text = ", ".join(
+                f"{source}: {rating}" for source, rating in movie_data.ratings.items()
+            )
+            overview_parts.append(f"Ratings: {ratings_text}")
 
         # Add review summary
         if movie_data.reviews:
             review_count = len(movie_data.reviews)
-            sources = set(review.source for review in movie_data.reviews)
             overview_parts.append(
-                f"Reviews: {review_count} reviews from {', '.join(sources)}"
+                f"Reviews: {review_count} reviews from {', '.join(movie_data.sources)}"
             )
 
         return " | ".join(overview_parts)
 
+    def _query_embedding(self, query_text: str) -> Optional[list]:
+        """Embed query text once per unique question, LRU-cached.
+
+        Returns None when the collection's embedding function can't be
+        reached, in which case the caller falls back to letting Chroma
+        embed the text itself.
+        """
+        key = hashlib.sha1(query_text.encode("utf-8")).digest()
+
+        cached = self._emb_cache.get(key)
+        if cached is not None:
+            self._emb_cache.move_to_end(key)
+            return cached
+
+        try:
+            embed = getattr(self.collection, "_embedding_function", None)
+            if embed is None:
+                return None
+            vector = list(embed([query_text])[0])
+        except Exception as e:
+            logger.debug(f"Query embedding unavailable: {e}")
+            return None
+
+        self._emb_cache[key] = vector
+        if len(self._emb_cache) > self._EMB_CACHE_SIZE:
+            self._emb_cache.popitem(last=False)
+        return vector
+
     def query(
         self,
         query_text: str,
         movie_title: Optional[str] = None,
         n_results: int = 5,
         include_overview: bool = True,
-    ) -> List[Dict[str, Any]]:
-        """Query the vector database for relevant documents."""
+        movie_titles: Optional[List[str]] = None,
+    ) -> List[QueryResult]:
+        """Query the vector database for relevant documents.
+
+        Pass ``movie_titles`` to search several movies in one call (a
+        single ``$in`` filter and HNSW search) instead of looping one
+        query per movie; ``movie_title`` remains the single-movie filter.
+        """
         try:
             # Build where clause for filtering
             where_clause = {}
 
-            if movie_title:
+            if movie_titles:
+                where_clause["movie_title"] = {"$in": list(movie_titles)}
+            elif movie_title:
                 where_clause["movie_title"] = {"$eq": movie_title}
 
-            # Debug: Log the query
-            print(f"DEBUG: Querying with text: '{query_text}', movie: {movie_title}")
-            logger.info(
-                f"Querying with text: '{query_text}', movie: {movie_title}, where: {where_clause}"
-            )
-
-            # Query the collection
-            results = self.collection.query(
-                query_texts=[query_text],
-                n_results=n_results,
-                where=where_clause if where_clause else None,
-                include=["documents", "metadatas", "distances"],
+            logger.debug(
+                "Querying with text: %r, movie: %s, where: %s",
+                query_text,
+                movie_title,
+                where_clause,
             )
 
-            # Debug: Log raw results
-            num_results = (
-                len(results.get("documents", [[]])[0])
-                if results.get("documents")
-                else 0
-            )
-            print(f"DEBUG: Raw query returned {num_results} results")
-            logger.info(f"Raw query returned {num_results} results")
+            # Query the collection, reusing a cached embedding for
+            # repeated question text when one is available
+            query_embedding = self._query_embedding(query_text)
+            if query_embedding is not None:
+                results = self.collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=n_results,
+                    where=where_clause if where_clause else None,
+                    include=["documents", "metadatas", "distances"],
+                )
+            else:
+                results = self.collection.query(
+                    query_texts=[query_text],
+                    n_results=n_results,
+                    where=where_clause if where_clause else None,
+                    include=["documents", "metadatas", "distances"],
+                )
 
             # Format results
             formatted_results = []
@@ -216,22 +371,24 @@ class VectorDatabase:
                     relevance_score = 1.0 - distance
 
                     logger.debug(
-                        f"Result {i+1}: distance={distance:.4f}, relevance={relevance_score:.4f}"
+                        "Result %d: distance=%.4f, relevance=%.4f",
+                        i + 1,
+                        distance,
+                        relevance_score,
                     )
 
                     formatted_results.append(
-                        {
-                            "content": doc,
-                            "metadata": metadata,
-                            "relevance_score": relevance_score,  # Use the calculated relevance_score
-                            "distance": distance,
-                        }
+                        QueryResult(
+                            content=doc,
+                            metadata=metadata,
+                            relevance_score=relevance_score,
+                            distance=distance,
+                        )
                     )
 
-            # Sort by relevance
-            formatted_results.sort(key=lambda x: x["relevance_score"], reverse=True)
-
-            logger.debug(f"Query returned {len(formatted_results)} results")
+            # Chroma already returns results in ascending-distance order,
+            # which is descending relevance, so no re-sort is needed
+            logger.debug("Query returned %d results", len(formatted_results))
 
             return formatted_results
 
@@ -242,16 +399,25 @@ class VectorDatabase:
     def get_movie_reviews(self, movie_title: str) -> List[Dict[str, Any]]:
         """Get all reviews for a specific movie."""
         try:
+            # Single equality predicate on the composite key instead of a
+            # $and over two metadata fields
             results = self.collection.get(
-                where={
-                    "$and": [
-                        {"movie_title": {"$eq": movie_title}},
-                        {"type": {"$eq": "review"}},
-                    ]
-                },
+                where={"composite_key": {"$eq": f"{movie_title}|review"}},
                 include=["documents", "metadatas"],
             )
 
+            if not results["documents"]:
+                # Documents ingested before the composite key existed
+                results = self.collection.get(
+                    where={
+                        "$and": [
+                            {"movie_title": {"$eq": movie_title}},
+                            {"type": {"$eq": "review"}},
+                        ]
+                    },
+                    include=["documents", "metadatas"],
+                )
+
             formatted_results = []
 
             if results["documents"]:
@@ -268,32 +434,79 @@ class VectorDatabase:
 
     def get_movies_list(self) -> List[str]:
         """Get list of all movies in the database."""
+        if self._movies_cache is not None:
+            return sorted(self._movies_cache)
+
         try:
             results = self.collection.get(
                 where={"type": {"$eq": "overview"}}, include=["metadatas"]
             )
 
-            movies = []
+            movies = set()
             if results["metadatas"]:
                 for metadata in results["metadatas"]:
                     movie_title = metadata.get("movie_title")
-                    if movie_title and movie_title not in movies:
-                        movies.append(movie_title)
+                    if movie_title:
+                        movies.add(movie_title)
 
+            self._movies_cache = movies
             return sorted(movies)
 
         except Exception as e:
             logger.error(f"Error getting movies list: {e}")
             return []
 
+    def has_movie(self, movie_title: str) -> bool:
+        """Check whether a movie is already in the database.
+
+        Answered from the cached title set when available; otherwise a
+        single limit-1 lookup instead of fetching every overview.
+        """
+        if self._movies_cache is not None:
+            return movie_title in self._movies_cache
+
+        try:
+            results = self.collection.get(
+                where={"composite_key": {"$eq": f"{movie_title}|overview"}},
+                limit=1,
+                include=[],
+            )
+            if results and results.get("ids"):
+                return True
+
+            # Documents ingested before the composite key existed
+            results = self.collection.get(
+                where={
+                    "$and": [
+                        {"movie_title": {"$eq": movie_title}},
+                        {"type": {"$eq": "overview"}},
+                    ]
+                },
+                limit=1,
+                include=[],
+            )
+            return bool(results and results.get("ids"))
+
+        except Exception as e:
+            logger.error(f"Error checking for movie '{movie_title}': {e}")
+            return False
+
     def delete_movie(self, movie_title: str) -> bool:
         """Delete all data for a specific movie."""
         try:
-            # Get all documents for the movie
-            results = self.collection.get(where={"movie_title": {"$eq": movie_title}})
+            # IDs are always returned even with an empty include list;
+            # metadatas are only fetched when the maintained stats
+            # counters are live and need decrementing
+            include = ["metadatas"] if self._stats is not None else []
+            results = self.collection.get(
+                where={"movie_title": {"$eq": movie_title}}, include=include
+            )
 
             if results and "ids" in results and results["ids"]:
                 self.collection.delete(ids=results["ids"])
+                if self._movies_cache is not None:
+                    self._movies_cache.discard(movie_title)
+                self._stats_record_delete(results.get("metadatas") or [])
                 logger.info(
                     f"Deleted {len(results['ids'])} documents for '{movie_title}'"
                 )
@@ -312,6 +525,9 @@ class VectorDatabase:
             # Delete the collection and recreate it
             self.client.delete_collection("movie_reviews")
             self._initialize_client()
+            self._movies_cache = None
+            self._stats = {"movies": 0, "reviews": 0, "sources": Counter()}
+            self._write_stats_sidecar_async()
             logger.info("Cleared vector database")
             return True
 
@@ -319,41 +535,108 @@ class VectorDatabase:
             logger.error(f"Error clearing database: {e}")
             return False
 
-    def get_stats(self) -> Dict[str, Any]:
-        """Get database statistics."""
+    def _load_stats_sidecar(self) -> Optional[Dict[str, Any]]:
+        """Load the persisted stats counters, if a sidecar exists."""
         try:
-            total_docs = self.collection.count()
-
-            # Get overview docs count (number of movies)
-            overview_results = self.collection.get(
-                where={"type": {"$eq": "overview"}}, include=["metadatas"]
-            )
-            movies_count = (
-                len(overview_results["metadatas"])
-                if overview_results["metadatas"]
-                else 0
-            )
+            with open(self._stats_path, encoding="utf-8") as f:
+                raw = json.load(f)
+            return {
+                "movies": int(raw["movies"]),
+                "reviews": int(raw["reviews"]),
+                "sources": Counter(raw["sources"]),
+            }
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+    def _write_stats_sidecar_async(self) -> None:
+        """Persist the stats counters off the caller's thread."""
+        if self._stats is None:
+            return
+        snapshot = {
+            "movies": self._stats["movies"],
+            "reviews": self._stats["reviews"],
+            "sources": dict(self._stats["sources"]),
+        }
+
+        def _write() -> None:
+            try:
+                with open(self._stats_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f)
+            except OSError as e:
+                logger.debug(f"Could not persist stats sidecar: {e}")
+
+        threading.Thread(target=_write, daemon=True).start()
+
+    def _stats_record_add(self, metadatas: List[Dict[str, Any]]) -> None:
+        """Update the maintained counters after an add."""
+        if self._stats is None:
+            return
+        for metadata in metadatas:
+            if metadata.get("type") == "overview":
+                self._stats["movies"] += 1
+            else:
+                self._stats["reviews"] += 1
+                self._stats["sources"][metadata.get("source", "unknown")] += 1
+        self._write_stats_sidecar_async()
+
+    def _stats_record_delete(self, metadatas: List[Dict[str, Any]]) -> None:
+        """Update the maintained counters after a delete."""
+        if self._stats is None:
+            return
+        sources = self._stats["sources"]
+        for metadata in metadatas:
+            if metadata.get("type") == "overview":
+                self._stats["movies"] -= 1
+            else:
+                self._stats["reviews"] -= 1
+                source = metadata.get("source", "unknown")
+                if sources[source] > 1:
+                    sources[source] -= 1
+                elif source in sources:
+                    # A stale sidecar may not hold the source at all;
+                    # Counter lookup returns 0 without inserting, so a
+                    # bare del would raise KeyError here
+                    del sources[source]
+        self._write_stats_sidecar_async()
+
+    def _rebuild_stats(self) -> Dict[str, Any]:
+        """Rebuild the counters with one full metadata scan."""
+        overview_results = self.collection.get(
+            where={"type": {"$eq": "overview"}}, include=["metadatas"]
+        )
+        review_results = self.collection.get(
+            where={"type": {"$eq": "review"}}, include=["metadatas"]
+        )
+
+        sources = Counter(
+            metadata.get("source", "unknown")
+            for metadata in review_results["metadatas"] or []
+        )
+
+        return {
+            "movies": len(overview_results["metadatas"] or []),
+            "reviews": len(review_results["metadatas"] or []),
+            "sources": sources,
+        }
 
-            # Get review docs count
-            review_results = self.collection.get(
-                where={"type": {"$eq": "review"}}, include=["metadatas"]
-            )
-            reviews_count = (
-                len(review_results["metadatas"]) if review_results["metadatas"] else 0
-            )
+    def get_stats(self) -> Dict[str, Any]:
+        """Get database statistics.
 
-            # Get source breakdown
-            source_counts = {}
-            if review_results["metadatas"]:
-                for metadata in review_results["metadatas"]:
-                    source = metadata.get("source", "unknown")
-                    source_counts[source] = source_counts.get(source, 0) + 1
+        Served from counters maintained on add/delete (persisted to a
+        stats.json sidecar), so polling stats doesn't re-scan every
+        review's metadata; the one-off rebuild only runs on a cold start
+        without a sidecar.
+        """
+        try:
+            if self._stats is None:
+                self._stats = self._rebuild_stats()
+                self._write_stats_sidecar_async()
 
             return {
-                "total_documents": total_docs,
-                "movies_count": movies_count,
-                "reviews_count": reviews_count,
-                "source_breakdown": source_counts,
+                "total_documents": self.collection.count(),
+                "movies_count": self._stats["movies"],
+                "reviews_count": self._stats["reviews"],
+                "source_breakdown": dict(self._stats["sources"]),
                 "database_path": self.db_path,
             }
 
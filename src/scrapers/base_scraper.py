@@ -2,26 +2,52 @@
 
 import asyncio
 import logging
+import re
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from typing import Any, Dict, List, Optional
 
 import aiohttp
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.edge.options import Options
-from selenium.webdriver.edge.service import Service
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from models.movie_data import MovieData, ReviewData, ScrapingResult
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C-based lxml parser; HTML parsing dominates per-page CPU
+# cost and lxml cuts it several-fold with the same BeautifulSoup API
+try:
+    import lxml  # noqa: F401
+
+    _BS_PARSER = "lxml"
+except ImportError:
+    _BS_PARSER = "html.parser"
+
+# c-ares resolver (aiodns) keeps DNS lookups off the thread executor;
+# brotli decoding is only advertised when the library can decode it
+try:
+    import aiodns  # noqa: F401
+
+    _HAS_AIODNS = True
+except ImportError:
+    _HAS_AIODNS = False
+
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    _ACCEPT_ENCODING = "gzip, deflate"
+
 
 @dataclass
 class ScrapingConfig:
@@ -34,26 +60,67 @@ class ScrapingConfig:
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     )
     max_reviews: int = 30
+    # Shared aiohttp session (e.g. from ScraperManager) so concurrent
+    # scrapers reuse one connection pool and DNS cache; scrapers that
+    # receive one do not close it
+    session: Optional[aiohttp.ClientSession] = None
+
+
+# Process-wide pooled session used by scrapers that run outside a
+# ScraperManager; kept open between scraper contexts so TCP+TLS
+# handshakes amortize across whole batches
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+async def _get_shared_session(config: "ScrapingConfig") -> aiohttp.ClientSession:
+    """Return the process-wide session, rebuilding it when stale.
+
+    The session is rebuilt when it was closed or belongs to a previous
+    event loop (successive asyncio.run calls each start a new loop).
+    """
+    global _SHARED_SESSION
+    loop = asyncio.get_running_loop()
+    if (
+        _SHARED_SESSION is None
+        or _SHARED_SESSION.closed
+        or getattr(_SHARED_SESSION, "_loop", None) is not loop
+    ):
+        if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
+            try:
+                await _SHARED_SESSION.close()
+            except Exception as e:
+                logger.debug(f"Could not close stale shared session: {e}")
+        _SHARED_SESSION = BaseScraper.build_session(config)
+    return _SHARED_SESSION
+
+
+async def close_shared_session() -> None:
+    """Close the process-wide session (e.g. at application shutdown)."""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is not None:
+        if not _SHARED_SESSION.closed:
+            await _SHARED_SESSION.close()
+        _SHARED_SESSION = None
 
 
 class BaseScraper(ABC):
     """Base class for all movie review scrapers."""
 
+    # Recently fetched pages kept per scraper so validate-then-scrape
+    # flows reuse the HTML instead of re-downloading it
+    _PAGE_CACHE_SIZE = 32
+    # Parsed movie pages kept per scraper: candidate validation parses
+    # the same title page scrape_movie_data needs right after
+    _MOVIE_CACHE_SIZE = 16
+
     def __init__(self, config: Optional[ScrapingConfig] = None):
         self.config = config or ScrapingConfig()
         self.session = None
         self.driver = None
-
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        if self.session and not self.session.closed:
-            # Schedule cleanup if we're in an event loop
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    loop.create_task(self.cleanup())
-            except RuntimeError:
-                pass  # No event loop running
+        # Caps concurrent fetches when callers gather several URLs
+        self._fetch_sem: Optional[asyncio.BoundedSemaphore] = None
+        self._page_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._movie_cache: "OrderedDict[str, MovieData]" = OrderedDict()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -64,35 +131,75 @@ class BaseScraper(ABC):
         """Async context manager exit."""
         await self.cleanup()
 
+    @staticmethod
+    def build_session(config: ScrapingConfig) -> aiohttp.ClientSession:
+        """Build a pooled aiohttp session for the given config."""
+        headers = {
+            "User-Agent": config.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": _ACCEPT_ENCODING,
+            "DNT": "1",
+            "Connection": "keep-alive",
+            "Upgrade-Insecure-Requests": "1",
+        }
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=config.timeout),
+            headers=headers,
+            # Pool connections and cache DNS so concurrent source
+            # scrapes overlap I/O instead of re-resolving/handshaking
+            connector=aiohttp.TCPConnector(
+                limit=16,
+                limit_per_host=4,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+                # Hold idle connections open for a minute so successive
+                # fetches against the same host skip the TCP+TLS
+                # handshake entirely
+                keepalive_timeout=60,
+                enable_cleanup_closed=True,
+            ),
+        )
+
     async def setup(self) -> None:
         """Setup the scraper (sessions, drivers, etc.)."""
+        if self._fetch_sem is None:
+            self._fetch_sem = asyncio.BoundedSemaphore(8)
         if not self.session:
-            headers = {
-                "User-Agent": self.config.user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate, br",
-                "DNT": "1",
-                "Connection": "keep-alive",
-                "Upgrade-Insecure-Requests": "1",
-            }
-            self.session = aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.config.timeout),
-                headers=headers,
-            )
+            shared = self.config.session
+            if shared is not None and not shared.closed:
+                # Shared pool owned by the caller (e.g. ScraperManager)
+                self.session = shared
+            else:
+                # Fall back to the process-wide pool so standalone
+                # scrapers still reuse connections across contexts
+                self.session = await _get_shared_session(self.config)
 
     async def cleanup(self) -> None:
-        """Cleanup resources."""
+        """Cleanup resources.
+
+        The session is always a shared pool (the caller's or the
+        process-wide one), so it is only detached here, never closed;
+        close_shared_session() tears down the process-wide pool.
+        """
         if self.session:
-            await self.session.close()
             self.session = None
         if self.driver:
             self.driver.quit()
             self.driver = None
 
-    def get_selenium_driver(self) -> webdriver.Edge:
-        """Get a configured Edge WebDriver."""
+    def get_selenium_driver(self) -> "webdriver.Edge":
+        """Get a configured Edge WebDriver.
+
+        Selenium is imported lazily here: no scraper uses it on the hot
+        path, and keeping it out of module import saves the Edge/driver
+        machinery for the rare caller that actually asks for it.
+        """
         if not self.driver:
+            from selenium import webdriver
+            from selenium.webdriver.edge.options import Options
+
             options = Options()
             options.add_argument("--headless")
             options.add_argument("--no-sandbox")
@@ -132,28 +239,97 @@ class BaseScraper(ABC):
         return self.driver
 
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        # Only transport-level failures are worth retrying; HTTP error
+        # statuses (e.g. 404 on a localized URL) return None immediately
+        # rather than burning 3 attempts of backoff
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=4),
     )
     async def fetch_page(self, url: str) -> Optional[str]:
-        """Fetch a web page with retry logic."""
-        # Ensure session is initialized
-        if not self.session:
+        """Fetch a web page with retry logic.
+
+        Successful pages are kept in a small per-scraper LRU: candidate
+        validation downloads the same title page scrape_movie_data needs
+        right after, so the second hit is served from memory.
+        """
+        cached = self._page_cache.get(url)
+        if cached is not None:
+            self._page_cache.move_to_end(url)
+            return cached
+
+        # Ensure session and semaphore are initialized
+        if not self.session or self._fetch_sem is None:
             await self.setup()
 
+        # Every network fetch goes through the bounded semaphore so
+        # gathered callers cannot flood the host past the pool size
+        async with self._fetch_sem:
+            try:
+                async with self.session.get(url) as response:
+                    if response.status == 200:
+                        # Decode from the declared charset (UTF-8
+                        # default) instead of response.text()'s charset
+                        # sniff, which runs chardet over the whole body
+                        # on every page
+                        raw = await response.read()
+                        html = raw.decode(
+                            response.charset or "utf-8", errors="replace"
+                        )
+                        self._page_cache[url] = html
+                        if len(self._page_cache) > self._PAGE_CACHE_SIZE:
+                            self._page_cache.popitem(last=False)
+                        return html
+                    else:
+                        logger.warning(f"HTTP {response.status} for URL: {url}")
+                        return None
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {e}")
+                raise
+
+    async def fetch_page_bounded(self, url: str) -> Optional[str]:
+        """Fetch a page, swallowing errors.
+
+        fetch_page itself enforces the concurrency cap; this wrapper
+        returns None on failure so callers can gather many URLs at once
+        and keep whichever responses arrived.
+        """
         try:
-            async with self.session.get(url) as response:
-                if response.status == 200:
-                    return await response.text()
-                else:
-                    logger.warning(f"HTTP {response.status} for URL: {url}")
-                    return None
+            return await self.fetch_page(url)
         except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
-            raise
+            logger.warning(f"Failed to fetch {url}: {e}")
+            return None
+
+    def _movie_cache_get(self, movie_url: str) -> Optional[MovieData]:
+        """Return a cached MovieData for the URL, or None.
+
+        Entries are copied on the way out (with an empty reviews list)
+        so scrape_movie attaching reviews never mutates the cache.
+        """
+        cached = self._movie_cache.get(movie_url)
+        if cached is None:
+            return None
+        self._movie_cache.move_to_end(movie_url)
+        return replace(cached, reviews=[])
+
+    def _movie_cache_store(self, movie_url: str, movie_data: MovieData) -> None:
+        """Cache parsed movie data for the URL."""
+        self._movie_cache[movie_url] = replace(movie_data, reviews=[])
+        if len(self._movie_cache) > self._MOVIE_CACHE_SIZE:
+            self._movie_cache.popitem(last=False)
 
     def parse_html(self, html: str) -> BeautifulSoup:
         """Parse HTML content with BeautifulSoup."""
-        return BeautifulSoup(html, "html.parser")
+        return BeautifulSoup(html, features=_BS_PARSER)
+
+    async def parse_html_threaded(self, html: str) -> BeautifulSoup:
+        """Parse HTML on a worker thread so the event loop stays free.
+
+        Parsing a large page blocks for tens to hundreds of ms; lxml
+        releases the GIL in its C parser, so in-flight fetches keep
+        progressing while the parse runs off-loop.
+        """
+        return await asyncio.to_thread(self.parse_html, html)
 
     async def rate_limit(self) -> None:
         """Apply rate limiting between requests."""
@@ -225,43 +401,36 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove extra whitespace
-    text = " ".join(text.split())
+    # Single substitution covers the whitespace collapsing, newline
+    # stripping and trimming the old multi-pass version did
+    return _WS_RE.sub(" ", text).strip()
+
 
-    # Remove common artifacts
-    text = text.replace("\n", " ").replace("\r", " ")
-    text = text.replace("  ", " ").strip()
+# Collapses any whitespace run in one C-level pass; clean_text runs on
+# every scraped text fragment
+_WS_RE = re.compile(r"\s+")
 
-    return text
+# Rating patterns compiled once and paired with their normalization to
+# a 0-10 scale; /100 is ordered before /10 so "75/100" isn't claimed by
+# the ten-point pattern. extract_rating runs for every review.
+_RATING_TABLE = (
+    (re.compile(r"(\d+(?:\.\d+)?)\s*/\s*100"), lambda rating: rating / 10),  # X/100
+    (re.compile(r"(\d+(?:\.\d+)?)\s*/\s*10"), lambda rating: rating),  # X/10
+    (re.compile(r"(\d+(?:\.\d+)?)\s*/\s*5"), lambda rating: rating * 2),  # X/5
+    (re.compile(r"(\d+(?:\.\d+)?)%"), lambda rating: rating / 10),  # X%
+    # Bare number: assume 0-10 if unclear
+    (
+        re.compile(r"(\d+(?:\.\d+)?)"),
+        lambda rating: rating if rating <= 10 else rating / 10,
+    ),
+)
 
 
 def extract_rating(text: str) -> Optional[float]:
-    """Extract numeric rating from text."""
-    import re
-
-    # Common rating patterns
-    patterns = [
-        r"(\d+(?:\.\d+)?)\s*/\s*10",  # X/10
-        r"(\d+(?:\.\d+)?)\s*/\s*5",  # X/5
-        r"(\d+(?:\.\d+)?)\s*/\s*100",  # X/100
-        r"(\d+(?:\.\d+)?)%",  # X%
-        r"(\d+(?:\.\d+)?)",  # Just number
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    """Extract numeric rating from text, normalized to a 0-10 scale."""
+    for pattern, normalize in _RATING_TABLE:
+        match = pattern.search(text)
         if match:
-            rating = float(match.group(1))
-
-            # Normalize to 0-10 scale
-            if "/10" in text:
-                return rating
-            elif "/5" in text:
-                return rating * 2
-            elif "/100" in text or "%" in text:
-                return rating / 10
-            else:
-                # Assume 0-10 if unclear
-                return rating if rating <= 10 else rating / 10
+            return normalize(float(match.group(1)))
 
     return None
@@ -1,8 +1,10 @@
 """Metacritic scraper implementation."""
 
+import asyncio
 import json
 import logging
 import re
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Optional
 from urllib.parse import quote, urljoin
@@ -12,6 +14,55 @@ from scrapers.base_scraper import BaseScraper, clean_text, extract_rating
 
 logger = logging.getLogger(__name__)
 
+# Compiled XPath expressions for the title page, evaluated in libxml2;
+# the soup path below stays as the fallback
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    _X_TITLE = etree.XPath('//h1[contains(@class, "product_page_title")]')
+    _X_H1 = etree.XPath("//h1")
+    _X_YEAR = etree.XPath('//span[contains(@class, "release_year")]')
+    _X_DIRECTOR = etree.XPath('//span[contains(text(), "Director:")]/../a')
+    _X_CAST = etree.XPath('//div[contains(@class, "summary_cast")]//a')
+    _X_GENRE = etree.XPath('//span[contains(text(), "Genre:")]/..')
+    _X_PLOT = etree.XPath('//div[contains(@class, "summary_deck")]')
+    _X_METASCORE = etree.XPath('//div[contains(@class, "metascore_w")]')
+    _X_USER_SCORE = etree.XPath(
+        '//div[contains(@class, "user_score")]'
+        '//div[contains(@class, "metascore_w")]'
+    )
+except ImportError:
+    lxml_html = None
+
+# selectolax parses the review pages several times faster than bs4; the
+# soup loops below stay as the fallback
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+_YEAR_RE = re.compile(r"(\d{4})")
+_DIRECTOR_RE = re.compile(r"Director:")
+_GENRE_RE = re.compile(r"Genre:")
+_HELPFUL_RE = re.compile(r"(\d+) of (\d+)")
+
+# strptime re-parses its format string on every call; review dates are
+# always "%b %d, %Y" so a month table plus split is much cheaper
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+
+def _parse_review_date(date_text: str) -> Optional[datetime]:
+    """Parse a "Mar 31, 1999" style review date without strptime."""
+    try:
+        month, day, year = date_text.replace(",", "").split()
+        return datetime(int(year), _MONTHS[month], int(day))
+    except (ValueError, KeyError):
+        return None
+
 
 class MetacriticScraper(BaseScraper):
     """Scraper for Metacritic movie reviews."""
@@ -19,6 +70,14 @@ class MetacriticScraper(BaseScraper):
     BASE_URL = "https://www.metacritic.com"
     SEARCH_URL = "https://www.metacritic.com/search/movie/"
 
+    # Slug-guessed URLs that came back missing; repeat searches skip
+    # the known-404 download
+    _DIRECT_MISS_CACHE_SIZE = 64
+
+    def __init__(self, config=None):
+        super().__init__(config)
+        self._direct_url_misses: "OrderedDict[str, None]" = OrderedDict()
+
     async def search_movie(
         self, title: str, year: Optional[int] = None
     ) -> Optional[str]:
@@ -32,12 +91,17 @@ class MetacriticScraper(BaseScraper):
                 # Try direct URL construction
                 movie_slug = title.replace(" ", "-").lower().replace(":", "")
                 direct_url = f"{self.BASE_URL}/movie/{movie_slug}"
+                if direct_url in self._direct_url_misses:
+                    return None
                 test_html = await self.fetch_page(direct_url)
                 if test_html and "404" not in test_html:
                     return direct_url
+                self._direct_url_misses[direct_url] = None
+                if len(self._direct_url_misses) > self._DIRECT_MISS_CACHE_SIZE:
+                    self._direct_url_misses.popitem(last=False)
                 return None
 
-            soup = self.parse_html(html)
+            soup = await self.parse_html_threaded(html)
 
             # Look for movie results
             result_elements = soup.find_all("div", class_="result_wrap")
@@ -57,11 +121,23 @@ class MetacriticScraper(BaseScraper):
 
     async def scrape_movie_data(self, movie_url: str) -> MovieData:
         """Scrape basic movie information from Metacritic."""
+        cached = self._movie_cache_get(movie_url)
+        if cached is not None:
+            return cached
+
         html = await self.fetch_page(movie_url)
         if not html:
             raise ValueError("Could not fetch movie page")
 
-        soup = self.parse_html(html)
+        if lxml_html is not None:
+            try:
+                movie_data = self._parse_movie_data_xpath(html)
+                self._movie_cache_store(movie_url, movie_data)
+                return movie_data
+            except Exception as e:
+                logger.warning(f"XPath movie parse failed, using soup: {e}")
+
+        soup = await self.parse_html_threaded(html)
 
         # Extract title
         title_elem = soup.find("h1", class_="product_page_title")
@@ -74,13 +150,13 @@ class MetacriticScraper(BaseScraper):
         year_elem = soup.find("span", class_="release_year")
         if year_elem:
             year_text = year_elem.text
-            year_match = re.search(r"(\d{4})", year_text)
+            year_match = _YEAR_RE.search(year_text)
             if year_match:
                 year = int(year_match.group(1))
 
         # Extract director
         director = None
-        director_elem = soup.find("span", string=re.compile(r"Director:"))
+        director_elem = soup.find("span", string=_DIRECTOR_RE)
         if director_elem:
             director_parent = director_elem.parent
             director_link = director_parent.find("a")
@@ -97,7 +173,7 @@ class MetacriticScraper(BaseScraper):
 
         # Extract genre
         genre = None
-        genre_elem = soup.find("span", string=re.compile(r"Genre:"))
+        genre_elem = soup.find("span", string=_GENRE_RE)
         if genre_elem:
             genre_parent = genre_elem.parent
             genre_text = genre_parent.text.replace("Genre(s):", "").strip()
@@ -130,6 +206,63 @@ class MetacriticScraper(BaseScraper):
                 except ValueError:
                     pass
 
+        movie_data = MovieData(
+            title=title,
+            year=year,
+            director=director,
+            cast=cast,
+            genre=genre,
+            plot_summary=plot_summary,
+            ratings=ratings,
+        )
+        self._movie_cache_store(movie_url, movie_data)
+        return movie_data
+
+    def _parse_movie_data_xpath(self, html: str) -> MovieData:
+        """Extract the movie fields with compiled XPath expressions."""
+        tree = lxml_html.fromstring(html)
+
+        nodes = _X_TITLE(tree) or _X_H1(tree)
+        title = clean_text(nodes[0].text_content()) if nodes else "Unknown"
+
+        year = None
+        nodes = _X_YEAR(tree)
+        if nodes:
+            year_match = _YEAR_RE.search(nodes[0].text_content())
+            if year_match:
+                year = int(year_match.group(1))
+
+        director = None
+        nodes = _X_DIRECTOR(tree)
+        if nodes:
+            director = clean_text(nodes[0].text_content())
+
+        cast = [clean_text(link.text_content()) for link in _X_CAST(tree)]
+
+        genre = None
+        nodes = _X_GENRE(tree)
+        if nodes:
+            genre_text = nodes[0].text_content().replace("Genre(s):", "").strip()
+            genre = clean_text(genre_text)
+
+        plot_summary = None
+        nodes = _X_PLOT(tree)
+        if nodes:
+            plot_summary = clean_text(nodes[0].text_content())
+
+        ratings = {}
+        nodes = _X_METASCORE(tree)
+        if nodes:
+            metascore_text = nodes[0].text_content().strip()
+            if metascore_text.isdigit():
+                ratings["metascore"] = float(metascore_text) / 10
+        nodes = _X_USER_SCORE(tree)
+        if nodes:
+            try:
+                ratings["user_score"] = float(nodes[0].text_content().strip())
+            except ValueError:
+                pass
+
         return MovieData(
             title=title,
             year=year,
@@ -144,17 +277,14 @@ class MetacriticScraper(BaseScraper):
         self, movie_url: str, max_reviews: int = 30
     ) -> List[ReviewData]:
         """Scrape reviews from Metacritic."""
-        reviews = []
-
-        # Get critic reviews
-        critic_reviews = await self._scrape_critic_reviews(movie_url, max_reviews // 2)
-        reviews.extend(critic_reviews)
-
-        # Get user reviews
-        user_reviews = await self._scrape_user_reviews(movie_url, max_reviews // 2)
-        reviews.extend(user_reviews)
+        # Critic and user reviews live on independent pages, so fetch
+        # both halves concurrently
+        critic_reviews, user_reviews = await asyncio.gather(
+            self._scrape_critic_reviews(movie_url, max_reviews // 2),
+            self._scrape_user_reviews(movie_url, max_reviews // 2),
+        )
 
-        return reviews[:max_reviews]
+        return (critic_reviews + user_reviews)[:max_reviews]
 
     async def _scrape_critic_reviews(
         self, movie_url: str, max_reviews: int
@@ -170,7 +300,17 @@ class MetacriticScraper(BaseScraper):
             if not html:
                 return reviews
 
-            soup = self.parse_html(html)
+            if HTMLParser is not None:
+                try:
+                    return self._parse_critic_reviews_fast(
+                        html, critic_url, max_reviews
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"selectolax critic review parse failed, using soup: {e}"
+                    )
+
+            soup = await self.parse_html_threaded(html)
 
             # Find critic review elements
             review_elements = soup.find_all("div", class_="review_section")
@@ -209,11 +349,7 @@ class MetacriticScraper(BaseScraper):
                     date = None
                     date_elem = elem.find("div", class_="review_date")
                     if date_elem:
-                        date_text = date_elem.text.strip()
-                        try:
-                            date = datetime.strptime(date_text, "%b %d, %Y")
-                        except:
-                            pass
+                        date = _parse_review_date(date_elem.text.strip())
 
                     review = ReviewData(
                         content=content,
@@ -237,6 +373,56 @@ class MetacriticScraper(BaseScraper):
 
         return reviews
 
+    def _parse_critic_reviews_fast(
+        self, html: str, critic_url: str, max_reviews: int
+    ) -> List[ReviewData]:
+        """Parse critic reviews with selectolax."""
+        dom = HTMLParser(html)
+
+        reviews = []
+        for node in dom.css("div.review_section")[:max_reviews]:
+            content_node = node.css_first("div.review_body")
+            if not content_node:
+                continue
+
+            content = clean_text(content_node.text())
+
+            author = None
+            publication = None
+            author_node = node.css_first("div.review_critic")
+            if author_node:
+                critic_link = author_node.css_first("a")
+                if critic_link:
+                    author = clean_text(critic_link.text())
+                source_node = author_node.css_first("em")
+                if source_node:
+                    publication = clean_text(source_node.text())
+
+            rating = None
+            score_node = node.css_first("div.review_grade")
+            if score_node:
+                rating = extract_rating(score_node.text().strip())
+
+            date = None
+            date_node = node.css_first("div.review_date")
+            if date_node:
+                date = _parse_review_date(date_node.text().strip())
+
+            reviews.append(
+                ReviewData(
+                    content=content,
+                    author=author,
+                    rating=rating,
+                    source="Metacritic",
+                    url=critic_url,
+                    date=date,
+                    review_type="critic",
+                    metadata={"publication": publication, "review_type": "critic"},
+                )
+            )
+
+        return reviews
+
     async def _scrape_user_reviews(
         self, movie_url: str, max_reviews: int
     ) -> List[ReviewData]:
@@ -251,7 +437,17 @@ class MetacriticScraper(BaseScraper):
             if not html:
                 return reviews
 
-            soup = self.parse_html(html)
+            if HTMLParser is not None:
+                try:
+                    return self._parse_user_reviews_fast(
+                        html, user_url, max_reviews
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"selectolax user review parse failed, using soup: {e}"
+                    )
+
+            soup = await self.parse_html_threaded(html)
 
             # Find user review elements
             review_elements = soup.find_all("div", class_="review_section")
@@ -287,18 +483,14 @@ class MetacriticScraper(BaseScraper):
                     date = None
                     date_elem = elem.find("div", class_="review_date")
                     if date_elem:
-                        date_text = date_elem.text.strip()
-                        try:
-                            date = datetime.strptime(date_text, "%b %d, %Y")
-                        except:
-                            pass
+                        date = _parse_review_date(date_elem.text.strip())
 
                     # Extract helpful votes
                     helpful_votes = None
                     helpful_elem = elem.find("span", class_="helpful_summary")
                     if helpful_elem:
                         helpful_text = helpful_elem.text
-                        helpful_match = re.search(r"(\d+) of (\d+)", helpful_text)
+                        helpful_match = _HELPFUL_RE.search(helpful_text)
                         if helpful_match:
                             helpful_votes = int(helpful_match.group(1))
 
@@ -324,3 +516,58 @@ class MetacriticScraper(BaseScraper):
             logger.error(f"Error scraping Metacritic user reviews: {e}")
 
         return reviews
+
+    def _parse_user_reviews_fast(
+        self, html: str, user_url: str, max_reviews: int
+    ) -> List[ReviewData]:
+        """Parse user reviews with selectolax."""
+        dom = HTMLParser(html)
+
+        reviews = []
+        for node in dom.css("div.review_section")[:max_reviews]:
+            content_node = node.css_first("div.review_body")
+            if not content_node:
+                continue
+
+            content = clean_text(content_node.text())
+
+            author = None
+            author_node = node.css_first("div.review_username a")
+            if author_node:
+                author = clean_text(author_node.text())
+
+            rating = None
+            score_node = node.css_first("div.review_grade")
+            if score_node:
+                try:
+                    rating = float(score_node.text().strip())
+                except ValueError:
+                    pass
+
+            date = None
+            date_node = node.css_first("div.review_date")
+            if date_node:
+                date = _parse_review_date(date_node.text().strip())
+
+            helpful_votes = None
+            helpful_node = node.css_first("span.helpful_summary")
+            if helpful_node:
+                helpful_match = _HELPFUL_RE.search(helpful_node.text())
+                if helpful_match:
+                    helpful_votes = int(helpful_match.group(1))
+
+            reviews.append(
+                ReviewData(
+                    content=content,
+                    author=author,
+                    rating=rating,
+                    source="Metacritic",
+                    url=user_url,
+                    date=date,
+                    review_type="user",
+                    helpful_votes=helpful_votes,
+                    metadata={"review_type": "user"},
+                )
+            )
+
+        return reviews
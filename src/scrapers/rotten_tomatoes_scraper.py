@@ -1,5 +1,6 @@
 """Rotten Tomatoes scraper implementation."""
 
+import asyncio
 import json
 import logging
 import re
@@ -11,6 +12,69 @@ from scrapers.base_scraper import BaseScraper, clean_text, extract_rating
 
 logger = logging.getLogger(__name__)
 
+# Compiled XPath expressions keep the title-page field lookups inside
+# libxml2's C evaluator instead of bs4's Python tree walks; the soup
+# path below stays as the fallback
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    _X_TITLE = etree.XPath('//h1[@data-qa="score-panel-movie-title"]')
+    _X_H1 = etree.XPath("//h1")
+    _X_INFO_ITEM = etree.XPath('//span[@data-qa="movie-info-item"]')
+    _X_DIRECTOR = etree.XPath('//a[@data-qa="movie-info-director"]')
+    _X_GENRE = etree.XPath('//span[@data-qa="movie-info-item-genre"]')
+    _X_SYNOPSIS = etree.XPath('//div[@data-qa="movie-info-synopsis"]')
+    _X_SCORE_BOARD = etree.XPath("//score-board")
+except ImportError:
+    lxml_html = None
+
+# selectolax parses the review pages several times faster than bs4; the
+# soup loops below stay as the fallback
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:
+    HTMLParser = None
+
+_YEAR_RE = re.compile(r"(\d{4})")
+_AUDIENCE_REVIEW_RE = re.compile(r"audience-review")
+_PRE_WRAP_RE = re.compile(r"pre-wrap")
+_DISPLAY_NAME_RE = re.compile(r"display-name")
+_STAR_DISPLAY_RE = re.compile(r"star-display")
+_FILLED_RE = re.compile(r"filled")
+
+# Review selectors shared by the selectolax and soup paths; the site
+# structure varies so each is tried in order
+_REVIEW_ROW_SELECTORS = (
+    '[data-qa="review-row"]',
+    "div.review-row",
+    'div[class*="review-row"]',
+    "div.review_table_row",
+    '[data-testid="critics-review"]',
+    ".critics-reviews .review-row",
+)
+_CRITIC_CONTENT_SELECTORS = (
+    '[data-qa="review-text"]',
+    ".the_review",
+    '[class*="review-text"]',
+    ".review-content",
+    "p",  # Last resort
+)
+_CRITIC_AUTHOR_SELECTORS = (
+    '[data-qa="review-critic-name"]',
+    ".display-name",
+    '[class*="critic-name"]',
+    'a[href*="/critics/"]',
+    ".author",
+)
+_CRITIC_ICON_SELECTOR = '[class*="icon"], .review-icon, [data-qa="review-icon"]'
+_CRITIC_PUB_SELECTORS = (
+    '[data-qa="review-publication"]',
+    ".subtle",
+    '[class*="publication"]',
+    ".source",
+)
+
 
 class RottenTomatoesScraper(BaseScraper):
     """Scraper for Rotten Tomatoes movie reviews."""
@@ -33,7 +97,7 @@ class RottenTomatoesScraper(BaseScraper):
             if not html:
                 return None
 
-            soup = self.parse_html(html)
+            soup = await self.parse_html_threaded(html)
 
             # Look for movie results with more specific selectors
             movie_selectors = [
@@ -47,8 +111,29 @@ class RottenTomatoesScraper(BaseScraper):
                 for link in links:
                     href = link.get("href")
                     if href and "/m/" in href:
-                        # Validate this is the right movie by checking title match
                         full_url = urljoin(self.BASE_URL, href)
+
+                        # Cheap pre-check against the search result card
+                        # itself; fetching the title page is only needed
+                        # when the card carries no usable metadata
+                        name_elem = link.select_one('[data-qa="info-name"]')
+                        card_title = clean_text(
+                            name_elem.text if name_elem else link.text
+                        )
+                        card = link.parent
+                        card_year = link.get("releaseyear") or (
+                            card.get("releaseyear") if card else None
+                        )
+                        card_match = self._validate_from_card(
+                            card_title, card_year, title, year
+                        )
+                        if card_match is True:
+                            return full_url
+                        if card_match is False:
+                            continue
+
+                        # Card was inconclusive; validate against the
+                        # movie page itself
                         if await self._validate_movie_match(full_url, title, year):
                             return full_url
 
@@ -58,6 +143,58 @@ class RottenTomatoesScraper(BaseScraper):
             logger.error(f"Error searching for {title}: {e}")
             return None
 
+    @staticmethod
+    def _titles_match(expected_title: str, actual_title: str) -> bool:
+        """Flexible title comparison shared by both validation paths."""
+        # Normalize titles for comparison
+        expected_normalized = expected_title.lower().strip()
+        actual_normalized = actual_title.lower().strip()
+
+        # Remove common articles and punctuation for better matching
+        for article in ["the ", "a ", "an "]:
+            if expected_normalized.startswith(article):
+                expected_normalized = expected_normalized[len(article) :]
+            if actual_normalized.startswith(article):
+                actual_normalized = actual_normalized[len(article) :]
+
+        return (
+            expected_normalized in actual_normalized
+            or actual_normalized in expected_normalized
+            or
+            # Check if they share significant words
+            len(set(expected_normalized.split()) & set(actual_normalized.split()))
+            >= 2
+        )
+
+    def _validate_from_card(
+        self,
+        card_title: str,
+        card_year: Optional[str],
+        expected_title: str,
+        expected_year: Optional[int],
+    ) -> Optional[bool]:
+        """Validate a candidate from its search result card alone.
+
+        Returns True/False when the card carries enough metadata to
+        decide, or None when the caller must fall back to fetching the
+        movie page.
+        """
+        if not card_title:
+            return None
+
+        if not self._titles_match(expected_title, card_title):
+            return False
+
+        if expected_year:
+            if not card_year:
+                return None
+            year_match = _YEAR_RE.search(card_year)
+            if not year_match:
+                return None
+            return abs(int(year_match.group(1)) - expected_year) <= 2
+
+        return True
+
     async def _validate_movie_match(
         self, movie_url: str, expected_title: str, expected_year: Optional[int] = None
     ) -> bool:
@@ -65,26 +202,7 @@ class RottenTomatoesScraper(BaseScraper):
         try:
             movie_data = await self.scrape_movie_data(movie_url)
 
-            # Normalize titles for comparison
-            expected_normalized = expected_title.lower().strip()
-            actual_normalized = movie_data.title.lower().strip()
-
-            # Remove common articles and punctuation for better matching
-            for article in ["the ", "a ", "an "]:
-                if expected_normalized.startswith(article):
-                    expected_normalized = expected_normalized[len(article) :]
-                if actual_normalized.startswith(article):
-                    actual_normalized = actual_normalized[len(article) :]
-
-            # Check title similarity (flexible matching)
-            title_match = (
-                expected_normalized in actual_normalized
-                or actual_normalized in expected_normalized
-                or
-                # Check if they share significant words
-                len(set(expected_normalized.split()) & set(actual_normalized.split()))
-                >= 2
-            )
+            title_match = self._titles_match(expected_title, movie_data.title)
 
             # Check year if provided (allow ±2 year difference for flexibility)
             year_match = True
@@ -107,11 +225,23 @@ class RottenTomatoesScraper(BaseScraper):
 
     async def scrape_movie_data(self, movie_url: str) -> MovieData:
         """Scrape basic movie information from Rotten Tomatoes."""
+        cached = self._movie_cache_get(movie_url)
+        if cached is not None:
+            return cached
+
         html = await self.fetch_page(movie_url)
         if not html:
             raise ValueError("Could not fetch movie page")
 
-        soup = self.parse_html(html)
+        if lxml_html is not None:
+            try:
+                movie_data = self._parse_movie_data_xpath(html)
+                self._movie_cache_store(movie_url, movie_data)
+                return movie_data
+            except Exception as e:
+                logger.warning(f"XPath movie parse failed, using soup: {e}")
+
+        soup = await self.parse_html_threaded(html)
 
         # Extract title
         title_elem = soup.find("h1", {"data-qa": "score-panel-movie-title"})
@@ -124,7 +254,7 @@ class RottenTomatoesScraper(BaseScraper):
         year_elem = soup.find("span", {"data-qa": "movie-info-item"})
         if year_elem:
             year_text = year_elem.text
-            year_match = re.search(r"(\d{4})", year_text)
+            year_match = _YEAR_RE.search(year_text)
             if year_match:
                 year = int(year_match.group(1))
 
@@ -163,6 +293,56 @@ class RottenTomatoesScraper(BaseScraper):
             if audience:
                 ratings["audience"] = float(audience) / 10
 
+        movie_data = MovieData(
+            title=title,
+            year=year,
+            director=director,
+            genre=genre,
+            plot_summary=plot_summary,
+            ratings=ratings,
+        )
+        self._movie_cache_store(movie_url, movie_data)
+        return movie_data
+
+    def _parse_movie_data_xpath(self, html: str) -> MovieData:
+        """Extract the movie fields with compiled XPath expressions."""
+        tree = lxml_html.fromstring(html)
+
+        nodes = _X_TITLE(tree) or _X_H1(tree)
+        title = clean_text(nodes[0].text_content()) if nodes else "Unknown"
+
+        year = None
+        nodes = _X_INFO_ITEM(tree)
+        if nodes:
+            year_match = _YEAR_RE.search(nodes[0].text_content())
+            if year_match:
+                year = int(year_match.group(1))
+
+        director = None
+        nodes = _X_DIRECTOR(tree)
+        if nodes:
+            director = clean_text(nodes[0].text_content())
+
+        genre = None
+        nodes = _X_GENRE(tree)
+        if nodes:
+            genre = clean_text(nodes[0].text_content())
+
+        plot_summary = None
+        nodes = _X_SYNOPSIS(tree)
+        if nodes:
+            plot_summary = clean_text(nodes[0].text_content())
+
+        ratings = {}
+        nodes = _X_SCORE_BOARD(tree)
+        if nodes:
+            tomatometer = nodes[0].get("tomatometerscore")
+            if tomatometer:
+                ratings["tomatometer"] = float(tomatometer) / 10
+            audience = nodes[0].get("audiencescore")
+            if audience:
+                ratings["audience"] = float(audience) / 10
+
         return MovieData(
             title=title,
             year=year,
@@ -176,19 +356,14 @@ class RottenTomatoesScraper(BaseScraper):
         self, movie_url: str, max_reviews: int = 30
     ) -> List[ReviewData]:
         """Scrape reviews from Rotten Tomatoes."""
-        reviews = []
-
-        # Get critic reviews
-        critic_reviews = await self._scrape_critic_reviews(movie_url, max_reviews // 2)
-        reviews.extend(critic_reviews)
-
-        # Get audience reviews
-        audience_reviews = await self._scrape_audience_reviews(
-            movie_url, max_reviews // 2
+        # Critic and audience reviews live on independent pages, so
+        # fetch both halves concurrently
+        critic_reviews, audience_reviews = await asyncio.gather(
+            self._scrape_critic_reviews(movie_url, max_reviews // 2),
+            self._scrape_audience_reviews(movie_url, max_reviews // 2),
         )
-        reviews.extend(audience_reviews)
 
-        return reviews[:max_reviews]
+        return (critic_reviews + audience_reviews)[:max_reviews]
 
     async def _scrape_critic_reviews(
         self, movie_url: str, max_reviews: int
@@ -205,21 +380,21 @@ class RottenTomatoesScraper(BaseScraper):
             if not html:
                 return reviews
 
-            soup = self.parse_html(html)
+            if HTMLParser is not None:
+                try:
+                    return self._parse_critic_reviews_fast(
+                        html, base_url, max_reviews
+                    )
+                except Exception as e:
+                    logger.warning(
+                        f"selectolax critic review parse failed, using soup: {e}"
+                    )
+
+            soup = await self.parse_html_threaded(html)
 
             # Look for the critics reviews section on the main page
-            # Try multiple selectors as the site structure may vary
-            review_selectors = [
-                '[data-qa="review-row"]',
-                "div.review-row",
-                'div[class*="review-row"]',
-                "div.review_table_row",
-                '[data-testid="critics-review"]',
-                ".critics-reviews .review-row",
-            ]
-
             review_elements = []
-            for selector in review_selectors:
+            for selector in _REVIEW_ROW_SELECTORS:
                 elements = soup.select(selector)
                 if elements:
                     review_elements = elements
@@ -229,15 +404,7 @@ class RottenTomatoesScraper(BaseScraper):
                 try:
                     # Extract review content - try multiple selectors
                     content = None
-                    content_selectors = [
-                        '[data-qa="review-text"]',
-                        ".the_review",
-                        '[class*="review-text"]',
-                        ".review-content",
-                        "p",  # Last resort
-                    ]
-
-                    for selector in content_selectors:
+                    for selector in _CRITIC_CONTENT_SELECTORS:
                         content_elem = elem.select_one(selector)
                         if content_elem:
                             content = clean_text(content_elem.text)
@@ -249,15 +416,7 @@ class RottenTomatoesScraper(BaseScraper):
 
                     # Extract author
                     author = None
-                    author_selectors = [
-                        '[data-qa="review-critic-name"]',
-                        ".display-name",
-                        '[class*="critic-name"]',
-                        'a[href*="/critics/"]',
-                        ".author",
-                    ]
-
-                    for selector in author_selectors:
+                    for selector in _CRITIC_AUTHOR_SELECTORS:
                         author_elem = elem.select_one(selector)
                         if author_elem:
                             author = clean_text(author_elem.text)
@@ -265,9 +424,7 @@ class RottenTomatoesScraper(BaseScraper):
 
                     # Extract rating (fresh/rotten)
                     rating = None
-                    rating_elem = elem.select_one(
-                        '[class*="icon"], .review-icon, [data-qa="review-icon"]'
-                    )
+                    rating_elem = elem.select_one(_CRITIC_ICON_SELECTOR)
                     if rating_elem:
                         classes = rating_elem.get("class", [])
                         class_text = " ".join(classes).lower()
@@ -278,14 +435,7 @@ class RottenTomatoesScraper(BaseScraper):
 
                     # Extract source publication
                     source_publication = None
-                    pub_selectors = [
-                        '[data-qa="review-publication"]',
-                        ".subtle",
-                        '[class*="publication"]',
-                        ".source",
-                    ]
-
-                    for selector in pub_selectors:
+                    for selector in _CRITIC_PUB_SELECTORS:
                         source_elem = elem.select_one(selector)
                         if source_elem:
                             source_publication = clean_text(source_elem.text)
@@ -315,6 +465,72 @@ class RottenTomatoesScraper(BaseScraper):
 
         return reviews
 
+    def _parse_critic_reviews_fast(
+        self, html: str, base_url: str, max_reviews: int
+    ) -> List[ReviewData]:
+        """Parse critic reviews with selectolax."""
+        dom = HTMLParser(html)
+
+        review_nodes = []
+        for selector in _REVIEW_ROW_SELECTORS:
+            nodes = dom.css(selector)
+            if nodes:
+                review_nodes = nodes
+                break
+
+        reviews = []
+        for node in review_nodes[:max_reviews]:
+            content = None
+            for selector in _CRITIC_CONTENT_SELECTORS:
+                content_node = node.css_first(selector)
+                if content_node:
+                    content = clean_text(content_node.text())
+                    if len(content) > 20:
+                        break
+
+            if not content or len(content) < 20:
+                continue
+
+            author = None
+            for selector in _CRITIC_AUTHOR_SELECTORS:
+                author_node = node.css_first(selector)
+                if author_node:
+                    author = clean_text(author_node.text())
+                    break
+
+            rating = None
+            rating_node = node.css_first(_CRITIC_ICON_SELECTOR)
+            if rating_node:
+                class_text = (rating_node.attributes.get("class") or "").lower()
+                if "fresh" in class_text:
+                    rating = 8.0  # Fresh = positive
+                elif "rotten" in class_text:
+                    rating = 3.0  # Rotten = negative
+
+            source_publication = None
+            for selector in _CRITIC_PUB_SELECTORS:
+                source_node = node.css_first(selector)
+                if source_node:
+                    source_publication = clean_text(source_node.text())
+                    break
+
+            reviews.append(
+                ReviewData(
+                    content=content,
+                    author=author or "Anonymous Critic",
+                    rating=rating,
+                    source="Rotten Tomatoes",
+                    review_type="critic",
+                    metadata={
+                        "publication": source_publication,
+                        "review_type": "critic",
+                        "url": base_url,
+                    },
+                )
+            )
+
+        return reviews
+
     async def _scrape_audience_reviews(
         self, movie_url: str, max_reviews: int
     ) -> List[ReviewData]:
@@ -329,32 +545,38 @@ class RottenTomatoesScraper(BaseScraper):
             if not html:
                 return reviews
 
-            soup = self.parse_html(html)
+            if HTMLParser is not None:
+                try:
+                    return self._parse_audience_reviews_fast(html, max_reviews)
+                except Exception as e:
+                    logger.warning(
+                        f"selectolax audience review parse failed, using soup: {e}"
+                    )
+
+            soup = await self.parse_html_threaded(html)
 
             # Find audience review elements
-            review_elements = soup.find_all(
-                "div", class_=re.compile(r"audience-review")
-            )
+            review_elements = soup.find_all("div", class_=_AUDIENCE_REVIEW_RE)
 
             for elem in review_elements[:max_reviews]:
                 try:
                     # Extract review content
-                    content_elem = elem.find("p", class_=re.compile(r"pre-wrap"))
+                    content_elem = elem.find("p", class_=_PRE_WRAP_RE)
                     if not content_elem:
                         continue
 
                     content = clean_text(content_elem.text)
 
                     # Extract author
-                    author_elem = elem.find("span", class_=re.compile(r"display-name"))
+                    author_elem = elem.find("span", class_=_DISPLAY_NAME_RE)
                     author = clean_text(author_elem.text) if author_elem else None
 
                     # Extract star rating
                     rating = None
-                    rating_elem = elem.find("span", class_=re.compile(r"star-display"))
+                    rating_elem = elem.find("span", class_=_STAR_DISPLAY_RE)
                     if rating_elem:
                         stars = len(
-                            rating_elem.find_all("span", class_=re.compile(r"filled"))
+                            rating_elem.find_all("span", class_=_FILLED_RE)
                         )
                         rating = stars * 2.0  # Convert 5-star to 10-point scale
 
@@ -377,3 +599,39 @@ class RottenTomatoesScraper(BaseScraper):
             logger.error(f"Error scraping audience reviews: {e}")
 
         return reviews
+
+    def _parse_audience_reviews_fast(
+        self, html: str, max_reviews: int
+    ) -> List[ReviewData]:
+        """Parse audience reviews with selectolax."""
+        dom = HTMLParser(html)
+
+        reviews = []
+        for node in dom.css('div[class*="audience-review"]')[:max_reviews]:
+            content_node = node.css_first('p[class*="pre-wrap"]')
+            if not content_node:
+                continue
+
+            content = clean_text(content_node.text())
+
+            author_node = node.css_first('span[class*="display-name"]')
+            author = clean_text(author_node.text()) if author_node else None
+
+            rating = None
+            rating_node = node.css_first('span[class*="star-display"]')
+            if rating_node:
+                stars = len(rating_node.css('span[class*="filled"]'))
+                rating = stars * 2.0  # Convert 5-star to 10-point scale
+
+            reviews.append(
+                ReviewData(
+                    content=content,
+                    author=author,
+                    rating=rating,
+                    source="Rotten Tomatoes",
+                    review_type="user",
+                    metadata={"review_type": "audience"},
+                )
+            )
+
+        return reviews
@@ -27,6 +27,7 @@ class ScraperManager:
     def __init__(self, config: Optional[ScrapingConfig] = None):
         self.config = config or ScrapingConfig()
         self.scrapers: Dict[str, BaseScraper] = {}
+        self._shared_session = None
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -38,7 +39,12 @@ class ScraperManager:
         await self.cleanup_scrapers()
 
     async def setup_scrapers(self) -> None:
-        """Initialize all scrapers."""
+        """Initialize all scrapers over one shared aiohttp session."""
+        if self.config.session is None or self.config.session.closed:
+            # All sources share one connection pool and DNS cache
+            self._shared_session = BaseScraper.build_session(self.config)
+            self.config.session = self._shared_session
+
         for source_name, scraper_class in self.SCRAPERS.items():
             scraper = scraper_class(self.config)
             await scraper.setup()
@@ -55,6 +61,12 @@ class ScraperManager:
 
         self.scrapers.clear()
 
+        if self._shared_session is not None:
+            await self._shared_session.close()
+            if self.config.session is self._shared_session:
+                self.config.session = None
+            self._shared_session = None
+
     async def scrape_movie_from_sources(
         self,
         title: str,
@@ -78,6 +90,7 @@ class ScraperManager:
             max_retries=self.config.max_retries,
             user_agent=self.config.user_agent,
             max_reviews=max_reviews,
+            session=self.config.session,
         )
 
         # Create scraping tasks
@@ -24,8 +24,8 @@ try:
 
         print(f"Found {len(results)} results:")
         for i, result in enumerate(results, 1):
-            score = result["relevance_score"]
-            content = result["content"][:100]
+            score = result.relevance_score
+            content = result.content[:100]
             print(f"  {i}. Score: {score:.3f} - {content}...")
 
 except Exception as e:
@@ -213,7 +213,7 @@ class TestMovieAnalysisCrew:
 
             # Validate tasks
             assert isinstance(tasks, list)
-            assert len(tasks) == 3  # Should create 3 tasks
+            assert len(tasks) == 1  # One consolidated JSON-output task
 
             for task in tasks:
                 # Each task should have required attributes
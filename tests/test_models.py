@@ -34,6 +34,16 @@ class TestReviewData:
 
         assert review.metadata == metadata
 
+    def test_display_excerpt_truncation(self):
+        """Test that long review content is truncated once for display."""
+        short_review = ReviewData(content="Short review", source="Test")
+        long_review = ReviewData(content="x" * 400, source="Test")
+
+        assert short_review.display_excerpt == "Short review"
+        assert long_review.display_excerpt == "x" * 300 + "..."
+        # Cached: repeated access returns the same object
+        assert long_review.display_excerpt is long_review.display_excerpt
+
     def test_review_data_minimal(self):
         """Test ReviewData with minimal required fields."""
         review = ReviewData(content="Test review", source="Test")
@@ -79,6 +89,30 @@ class TestMovieData:
         assert len(another_source_reviews) == 1
         assert all(review.source == "Test Source" for review in test_source_reviews)
 
+    def test_sources_deduped_in_order(self, sample_movie_data):
+        """Test unique sources preserve first-seen order and track additions."""
+        movie = sample_movie_data
+
+        assert movie.sources == ["Test Source", "Another Source"]
+
+        movie.add_review(ReviewData(content="New review", source="Third Source"))
+
+        assert movie.sources == ["Test Source", "Another Source", "Third Source"]
+
+    def test_get_reviews_by_type(self, sample_movie_data):
+        """Test partitioning reviews by type."""
+        movie = sample_movie_data
+
+        critic_reviews = movie.get_reviews_by_type("critic")
+        user_reviews = movie.get_reviews_by_type("user")
+
+        assert len(critic_reviews) + len(user_reviews) == len(movie.reviews)
+        assert all(r.review_type == "critic" for r in critic_reviews)
+
+        # Cache revalidates when reviews are added
+        movie.add_review(ReviewData(content="Late review", source="Test"))
+        assert len(movie.get_reviews_by_type("user")) == len(user_reviews) + 1
+
     def test_get_average_rating(self, sample_movie_data):
         """Test calculating average rating."""
         movie = sample_movie_data
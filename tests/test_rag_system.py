@@ -10,9 +10,17 @@ import pytest
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+import numpy as np
+
 from models.movie_data import MovieData, ReviewData
 from rag.movie_rag_system import MovieRAGSystem
-from rag.vector_database import VectorDatabase
+from rag.similarity import (
+    cosine_distances,
+    cosine_distances_int8,
+    cosine_top_k,
+    quantize_int8,
+)
+from rag.vector_database import QueryResult, VectorDatabase
 
 
 class TestVectorDatabase:
@@ -64,9 +72,38 @@ class TestVectorDatabase:
         call_args = mock_collection.add.call_args
         documents = call_args[1]["documents"]
 
-        # Should have movie overview + reviews
+        # Should have movie overview + reviews, all embedded in one batch
         expected_docs = 1 + len(sample_movie_data.reviews)  # overview + reviews
         assert len(documents) == expected_docs
+        assert len(call_args[1]["metadatas"]) == expected_docs
+        assert len(call_args[1]["ids"]) == expected_docs
+
+    def test_add_movies_bulk(self, temp_db_path, mock_chroma_client, sample_movie_data):
+        """Test bulk-adding movies issues a single collection write."""
+        mock_client, mock_collection = mock_chroma_client
+
+        other_movie = MovieData(
+            title="Other Movie",
+            year=2022,
+            reviews=[
+                ReviewData(
+                    content="A perfectly serviceable film with solid performances.",
+                    author="Critic",
+                    rating=7.0,
+                    source="Test Source",
+                    review_type="critic",
+                )
+            ],
+        )
+
+        db = VectorDatabase(temp_db_path)
+        db.add_movies_bulk([sample_movie_data, other_movie])
+
+        # All documents from both movies should go through one add call
+        mock_collection.add.assert_called_once()
+        documents = mock_collection.add.call_args[1]["documents"]
+        expected_docs = 2 + len(sample_movie_data.reviews) + 1  # overviews + reviews
+        assert len(documents) == expected_docs
 
     def test_query_vector_database(self, temp_db_path, mock_chroma_client):
         """Test querying the vector database."""
@@ -80,9 +117,19 @@ class TestVectorDatabase:
 
         # Should return formatted results
         assert len(results) == 1
-        assert results[0]["content"] == "Test document"
-        assert results[0]["metadata"]["movie_title"] == "Test Movie"
-        assert "relevance_score" in results[0]
+        assert results[0].content == "Test document"
+        assert results[0].metadata["movie_title"] == "Test Movie"
+        assert results[0].relevance_score == pytest.approx(0.9)
+
+    def test_query_multiple_movies(self, temp_db_path, mock_chroma_client):
+        """Test multi-movie queries use one $in filter."""
+        mock_client, mock_collection = mock_chroma_client
+
+        db = VectorDatabase(temp_db_path)
+        db.query("test query", movie_titles=["Movie 1", "Movie 2"])
+
+        where = mock_collection.query.call_args[1]["where"]
+        assert where == {"movie_title": {"$in": ["Movie 1", "Movie 2"]}}
 
     def test_get_movies_list(self, temp_db_path, mock_chroma_client):
         """Test getting list of movies."""
@@ -114,6 +161,68 @@ class TestVectorDatabase:
         mock_collection.delete.assert_called_once_with(ids=["doc1", "doc2", "doc3"])
 
 
+class TestSimilarity:
+    """Test client-side similarity helpers."""
+
+    def test_cosine_distances(self):
+        """Test cosine distance computation against known vectors."""
+        query = np.array([1.0, 0.0], dtype=np.float32)
+        corpus = np.array([[1.0, 0.0], [0.0, 1.0], [-1.0, 0.0]], dtype=np.float32)
+
+        distances = cosine_distances(query, corpus)
+
+        assert distances.shape == (3,)
+        assert distances[0] == pytest.approx(0.0, abs=1e-5)
+        assert distances[1] == pytest.approx(1.0, abs=1e-5)
+        assert distances[2] == pytest.approx(2.0, abs=1e-5)
+
+    def test_cosine_top_k(self):
+        """Test top-k selection returns nearest rows first."""
+        query = np.array([1.0, 0.0], dtype=np.float32)
+        corpus = np.array(
+            [[0.0, 1.0], [1.0, 0.1], [1.0, 0.0], [-1.0, 0.0]], dtype=np.float32
+        )
+
+        indices, distances = cosine_top_k(query, corpus, k=2)
+
+        assert list(indices) == [2, 1]
+        assert distances[0] <= distances[1]
+
+    def test_quantize_int8_roundtrip(self):
+        """Test int8 quantization reconstructs vectors within scale error."""
+        vectors = np.array([[0.5, -0.25, 0.1], [1.0, 0.0, -1.0]], dtype=np.float32)
+
+        quantized, scales = quantize_int8(vectors)
+
+        assert quantized.dtype == np.int8
+        reconstructed = quantized.astype(np.float32) * scales[:, None]
+        assert np.allclose(reconstructed, vectors, atol=1e-2)
+
+    def test_cosine_distances_int8_matches_float(self):
+        """Test int8 cosine distances track the FP32 result."""
+        rng = np.random.default_rng(42)
+        query = rng.normal(size=16).astype(np.float32)
+        corpus = rng.normal(size=(8, 16)).astype(np.float32)
+
+        q_query, _ = quantize_int8(query)
+        q_corpus, _ = quantize_int8(corpus)
+
+        distances = cosine_distances_int8(q_query.ravel(), q_corpus)
+        expected = cosine_distances(query, corpus)
+
+        assert np.allclose(distances, expected, atol=0.02)
+
+    def test_cosine_top_k_small_corpus(self):
+        """Test top-k with k larger than the corpus."""
+        query = np.array([1.0, 0.0], dtype=np.float32)
+        corpus = np.array([[1.0, 0.0]], dtype=np.float32)
+
+        indices, distances = cosine_top_k(query, corpus, k=5)
+
+        assert len(indices) == 1
+        assert len(distances) == 1
+
+
 class TestMovieRAGSystem:
     """Test MovieRAGSystem functionality."""
 
@@ -162,10 +271,11 @@ class TestMovieRAGSystem:
         rag_system, mock_vdb, mock_llm = mock_rag_system
 
         # Mock existing movies check
-        mock_vdb.get_movies_list.return_value = []
+        mock_vdb.has_movie.return_value = False
 
         rag_system.add_movie_data(sample_movie_data)
 
+        mock_vdb.delete_movie.assert_not_called()
         mock_vdb.add_movie_data.assert_called_once_with(sample_movie_data)
 
     def test_add_movie_data_existing(self, mock_rag_system, sample_movie_data):
@@ -173,7 +283,7 @@ class TestMovieRAGSystem:
         rag_system, mock_vdb, mock_llm = mock_rag_system
 
         # Mock existing movie
-        mock_vdb.get_movies_list.return_value = ["Test Movie"]
+        mock_vdb.has_movie.return_value = True
         mock_vdb.delete_movie.return_value = True
 
         rag_system.add_movie_data(sample_movie_data)
@@ -181,17 +291,40 @@ class TestMovieRAGSystem:
         mock_vdb.delete_movie.assert_called_once_with("Test Movie")
         mock_vdb.add_movie_data.assert_called_once_with(sample_movie_data)
 
+    def test_add_movie_data_async_flush(self, mock_rag_system, sample_movie_data):
+        """Test queued movies are written in one batch on flush."""
+        rag_system, mock_vdb, mock_llm = mock_rag_system
+
+        mock_vdb.has_movie.return_value = False
+
+        rag_system.add_movie_data_async(sample_movie_data)
+        rag_system.add_movie_data_async(sample_movie_data)
+
+        # Nothing written until the flush
+        mock_vdb.add_movies_bulk.assert_not_called()
+
+        rag_system.flush()
+
+        mock_vdb.add_movies_bulk.assert_called_once_with(
+            [sample_movie_data, sample_movie_data]
+        )
+
+        # A second flush with an empty queue is a no-op
+        rag_system.flush()
+        mock_vdb.add_movies_bulk.assert_called_once()
+
     def test_query_with_llm(self, mock_rag_system):
         """Test querying RAG system with LLM."""
         rag_system, mock_vdb, mock_llm = mock_rag_system
 
         # Mock vector database response
         mock_vdb.query.return_value = [
-            {
-                "content": "Test content",
-                "metadata": {"source": "test"},
-                "relevance_score": 0.8,
-            }
+            QueryResult(
+                content="Test content",
+                metadata={"source": "test"},
+                relevance_score=0.8,
+                distance=0.2,
+            )
         ]
 
         response = rag_system.query("What do you think about this movie?")
@@ -199,6 +332,67 @@ class TestMovieRAGSystem:
         assert isinstance(response, str)
         mock_vdb.query.assert_called_once()
 
+    def test_query_semantic_cache_hit(self, mock_rag_system):
+        """Test near-duplicate questions are served from the semantic cache."""
+        rag_system, mock_vdb, mock_llm = mock_rag_system
+
+        mock_vdb.query.return_value = [
+            QueryResult(
+                content="Test content",
+                metadata={"source": "test"},
+                relevance_score=0.8,
+                distance=0.2,
+            )
+        ]
+
+        # Deterministic embedding: both phrasings map to the same vector
+        rag_system._embed_question = lambda question: np.array(
+            [1.0, 0.0], dtype=np.float32
+        )
+
+        first = rag_system.query("Is it good?")
+        second = rag_system.query("Was it good?")
+
+        # Second phrasing is answered from the cache without retrieval
+        assert second == first
+        mock_vdb.query.assert_called_once()
+
+    def test_query_stream_groq(self, mock_rag_system):
+        """Test streaming queries yield Groq delta fragments in order."""
+        rag_system, mock_vdb, mock_llm = mock_rag_system
+
+        mock_vdb.query.return_value = [
+            QueryResult(
+                content="Test content",
+                metadata={"source": "test"},
+                relevance_score=0.8,
+                distance=0.2,
+            )
+        ]
+
+        def make_chunk(text):
+            chunk = Mock()
+            chunk.choices = [Mock()]
+            chunk.choices[0].delta.content = text
+            return chunk
+
+        rag_system.llm = Mock()
+        rag_system.llm_type = "groq"
+        rag_system.model_name = "test-model"
+        rag_system.llm.chat.completions.create.return_value = iter(
+            [make_chunk("Great "), make_chunk("movie."), make_chunk(None)]
+        )
+
+        fragments = list(rag_system.query_stream("Is it good?"))
+
+        assert fragments == ["Great ", "movie."]
+        call_kwargs = rag_system.llm.chat.completions.create.call_args[1]
+        assert call_kwargs["stream"] is True
+
+        # The assembled response lands in the cache for plain query calls
+        assert rag_system.query("Is it good?") == "Great movie."
+        mock_vdb.query.assert_called_once()
+
     def test_query_no_results(self, mock_rag_system):
         """Test querying when no relevant documents found."""
         rag_system, mock_vdb, mock_llm = mock_rag_system
@@ -216,11 +410,12 @@ class TestMovieRAGSystem:
 
         # Mock response with low similarity
         mock_vdb.query.return_value = [
-            {
-                "content": "Test content",
-                "metadata": {"source": "test"},
-                "relevance_score": 0.3,  # Below threshold
-            }
+            QueryResult(
+                content="Test content",
+                metadata={"source": "test"},
+                relevance_score=0.3,  # Below threshold
+                distance=0.7,
+            )
         ]
 
         response = rag_system.query("Test question", similarity_threshold=0.7)
@@ -280,11 +475,12 @@ class TestMovieRAGSystem:
                 # Mock vector database response
                 mock_vdb_instance = Mock()
                 mock_vdb_instance.query.return_value = [
-                    {
-                        "content": "Test review content",
-                        "metadata": {"source": "test", "author": "reviewer"},
-                        "relevance_score": 0.8,
-                    }
+                    QueryResult(
+                        content="Test review content",
+                        metadata={"source": "test", "author": "reviewer"},
+                        relevance_score=0.8,
+                        distance=0.2,
+                    )
                 ]
                 rag_system.vector_db = mock_vdb_instance
 
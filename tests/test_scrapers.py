@@ -82,7 +82,8 @@ class TestBaseScraper:
         with patch("aiohttp.ClientSession.get") as mock_get:
             mock_response = AsyncMock()
             mock_response.status = 200
-            mock_response.text.return_value = "<html>Test content</html>"
+            mock_response.charset = None
+            mock_response.read.return_value = b"<html>Test content</html>"
             mock_get.return_value.__aenter__.return_value = mock_response
 
             async with mock_scraper: